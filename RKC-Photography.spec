@@ -32,6 +32,10 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    # Byte-compile like `python -OO`: strips docstrings and asserts from the
+    # bundled modules, for smaller .pyc files and faster cold-start imports.
+    # Requires PyInstaller >= 6.6.
+    optimize=2,
 )
 
 pyz = PYZ(
@@ -18,16 +18,25 @@ Requirements:
 import os
 import sys
 import argparse
-import webview
+import pathlib
+import functools
+import multiprocessing
+
+# Pin PyWebView to the Qt backend so it doesn't probe other GUI toolkits
+# (an existing PYWEBVIEW_GUI value is left untouched)
+os.environ.setdefault('PYWEBVIEW_GUI', 'qt')
 
 # Add project root to path for imports
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.api import Api
-from src.config import clear_cache
+# PyWebView and the API are imported where they are used rather than here:
+# batch worker processes (spawn/forkserver) import this module again as
+# __mp_main__ and only need the image processing code
+from src.config import clear_cache, load_dependency_cache, save_dependency_cache
 
 
+@functools.lru_cache(maxsize=1)
 def get_ui_path() -> str:
     """
     Get the path to the UI directory.
@@ -52,18 +61,31 @@ def check_dependencies() -> list:
     """
     errors = []
     
-    # Check PyWebView
-    try:
-        import webview
-    except ImportError:
-        errors.append("PyWebView is not installed. Run: pip install pywebview")
+    # PyWebView is checked at the start of main() (nothing can be shown without it)
     
     # Check Wand (ImageMagick binding)
     try:
-        from wand.image import Image
-        # Try to create a small test image to verify ImageMagick is working
-        with Image(width=1, height=1, background='white') as img:
-            pass
+        from wand.version import VERSION as WAND_VERSION, MAGICK_VERSION
+        
+        # Creating an image initializes MagickCore, which is slow. Only do it
+        # on first launch or after Wand/ImageMagick has been upgraded.
+        cache = load_dependency_cache()
+        probe_cached = (
+            cache.get('wand_ok') is True
+            and cache.get('wand_version') == WAND_VERSION
+            and cache.get('magick_version') == MAGICK_VERSION
+        )
+        
+        if not probe_cached:
+            from wand.image import Image
+            # Try to create a small test image to verify ImageMagick is working
+            with Image(width=1, height=1, background='white') as img:
+                pass
+            save_dependency_cache({
+                'wand_ok': True,
+                'wand_version': WAND_VERSION,
+                'magick_version': MAGICK_VERSION
+            })
     except ImportError:
         errors.append("Wand is not installed. Run: pip install wand")
     except Exception as e:
@@ -141,32 +163,73 @@ def create_error_html(errors: list) -> str:
     """
 
 
-def main():
-    """Main entry point for the application."""
-    # Parse command-line arguments
-    parser = argparse.ArgumentParser(description='RKC Photography - Image Processing Application')
-    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
-    args = parser.parse_args()
+# Shown while dependencies are checked and the API is created.
+# Pure HTML/CSS (no scripts or external assets) so it paints immediately.
+SPLASH_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>RKC Photography</title>
+    <style>
+        body {
+            background: #0d0d0d;
+            color: #a0a0a0;
+            font-family: -apple-system, BlinkMacSystemFont, sans-serif;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            height: 100vh;
+            margin: 0;
+        }
+        .spinner {
+            width: 40px;
+            height: 40px;
+            border: 3px solid rgba(255, 255, 255, 0.12);
+            border-top-color: #d4a853;
+            border-radius: 50%;
+            animation: spin 0.8s linear infinite;
+        }
+        p {
+            margin-top: 16px;
+            font-size: 14px;
+        }
+        @keyframes spin {
+            to { transform: rotate(360deg); }
+        }
+    </style>
+</head>
+<body>
+    <div class="spinner"></div>
+    <p>Loading RKC Photography...</p>
+</body>
+</html>
+"""
+
+
+def _deferred_init(window, status: dict) -> None:
+    """
+    Finish application startup after the splash window is visible.
     
+    Runs in PyWebView's background thread. Checks dependencies, creates the
+    API, exposes its methods to JavaScript and then loads the real UI.
+    Sets status['exit_code'] to a non-zero value if startup failed.
+    """
     # Check dependencies first
     dependency_errors = check_dependencies()
     
     if dependency_errors:
-        # Show error window if dependencies are missing
+        # Replace the splash with the error page if dependencies are missing
         print("ERROR: Missing dependencies:")
         for error in dependency_errors:
             print(f"  - {error}")
         print("\nShowing error dialog...")
         
-        window = webview.create_window(
-            title='RKC Photography - Error',
-            html=create_error_html(dependency_errors),
-            width=700,
-            height=500,
-            resizable=True
-        )
-        webview.start(debug=True)
-        sys.exit(1)
+        window.set_title('RKC Photography - Error')
+        window.load_html(create_error_html(dependency_errors))
+        status['exit_code'] = 1
+        return
     
     # Get UI path
     ui_path = get_ui_path()
@@ -175,16 +238,44 @@ def main():
     if not os.path.exists(index_html):
         print(f"ERROR: UI files not found at {ui_path}")
         print("Make sure the 'ui' folder exists and contains index.html")
-        sys.exit(1)
+        status['exit_code'] = 1
+        window.destroy()
+        return
     
-    # Create API instance
+    from src.api import Api
+    
+    # Create API instance and set window reference for callbacks
     api = Api()
+    api.set_window(window)
+    
+    # Expose all public API methods as window.pywebview.api.<name>
+    window.expose(*[
+        getattr(api, name) for name in dir(api)
+        if not name.startswith('_') and name != 'set_window' and callable(getattr(api, name))
+    ])
     
-    # Create the main window
+    window.load_url(pathlib.Path(index_html).as_uri())
+
+
+def main():
+    """Main entry point for the application."""
+    # Without PyWebView there is no window to show errors in, so report on the console
+    try:
+        import webview
+    except ImportError:
+        print("ERROR: PyWebView is not installed. Run: pip install pywebview")
+        sys.exit(1)
+    
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description='RKC Photography - Image Processing Application')
+    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    args = parser.parse_args()
+    
+    # Create the main window with a splash page so something is on screen
+    # right away; the real UI is loaded by _deferred_init once ready.
     window = webview.create_window(
         title='RKC Photography',
-        url=index_html,
-        js_api=api,
+        html=SPLASH_HTML,
         width=1200,
         height=800,
         min_size=(900, 600),
@@ -193,18 +284,26 @@ def main():
         background_color='#0d0d0d'  # Match app background
     )
     
-    # Set window reference in API for callbacks
-    api.set_window(window)
+    status = {'exit_code': 0}
     
     # Start the application
     # Use Qt backend on Windows to avoid pythonnet dependency issues with newer Python versions
     # Other options: 'edgechromium', 'cef', 'mshtml', 'qt' (auto-detected)
-    webview.start(debug=args.debug, gui='qt')
+    webview.start(_deferred_init, (window, status), debug=args.debug, gui='qt')
+    
+    # Tear down the shared Tk root used for file dialogs on its own thread
+    from src.api import shutdown_dialogs
+    shutdown_dialogs()
+    
+    if status['exit_code']:
+        sys.exit(status['exit_code'])
     
     # Clear cache on exit so the app starts fresh next time
     clear_cache()
 
 
 if __name__ == '__main__':
+    # Lets worker processes of a frozen (PyInstaller) build start the worker
+    # instead of another copy of the app
+    multiprocessing.freeze_support()
     main()
-
@@ -7,27 +7,64 @@ Provides progress reporting, error collection, and cancellation support.
 Supports both sequential and parallel processing:
 - Sequential: Lower memory usage, simpler error handling
 - Parallel: Faster processing using multiple CPU cores via ProcessPoolExecutor
+  (or ThreadPoolExecutor, see ProcessingConfig.executor_kind)
 """
 
+import gc
 import os
+import sys
+import queue
+import shutil
+import itertools
+import functools
+import time
 import threading
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, as_completed, Future, TimeoutError as FuturesTimeoutError
-from typing import Optional, Callable, List, Dict, Any, Literal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from multiprocessing import shared_memory
+from typing import Optional, Callable, List, Dict, Any, Iterator, Set, Tuple, Literal
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from enum import Enum
 
+from . import image_processor, vips_backend
 from .image_processor import (
     is_supported_format,
-    process_single_image,
     SUPPORTED_FORMATS,
     WATERMARK_POSITIONS
 )
+from .vips_backend import VIPS_AVAILABLE
 
 
+# The config/progress dataclasses get __slots__ (smaller instances, faster
+# attribute access) where dataclass supports it (Python 3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# For set lookups when validating watermark positions
+_WATERMARK_POSITION_SET = frozenset(WATERMARK_POSITIONS)
+
+# Minimum time between progress callbacks while a batch is running (seconds)
+PROGRESS_NOTIFY_INTERVAL = 0.1
+
+# Maximum number of error details kept per batch (further errors are only counted)
+MAX_ERRORS = 1000
+
+# Report the number of images found every this many files while scanning
+SCAN_PROGRESS_STEP = 256
+
+# Largest number of images sent to a worker process in one task. Batching a
+# few images per task saves pickling and IPC round trips, while small chunks
+# keep progress updates and cancellation responsive
+MAX_TASK_CHUNK = 4
+
+# Watermarks with fewer raw RGBA bytes than this are decoded by each worker
+# process itself rather than shared through shared memory (1 MB)
+SHARED_WATERMARK_MIN_BYTES = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
 def _get_default_workers() -> int:
     """
-    Get default number of workers based on CPU count.
+    Get default number of workers based on CPU count (computed once).
     
     Optimized for large batches (300-400+ images):
     - Uses most available CPUs for maximum throughput
@@ -44,34 +81,238 @@ def _get_default_workers() -> int:
         return min(cpu_count - 2, 12)
 
 
-def _process_image_worker(
-    input_path: str,
-    output_path: str,
+# Start method context for worker processes, created on first use
+_MP_CONTEXT: Optional[multiprocessing.context.BaseContext] = None
+
+
+def _get_mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the multiprocessing context used to start worker processes.
+    
+    On POSIX this is a forkserver that has already imported the image
+    processing module, so workers start by forking that warm server
+    instead of re-importing the app (spawn). Plain fork is avoided because
+    the batch runs in a background thread of a multi-threaded process.
+    Windows only supports spawn, and frozen builds keep the default.
+    """
+    global _MP_CONTEXT
+    if _MP_CONTEXT is None:
+        if os.name == "posix" and not getattr(sys, "frozen", False):
+            _MP_CONTEXT = multiprocessing.get_context("forkserver")
+            _MP_CONTEXT.set_forkserver_preload([image_processor.__name__, vips_backend.__name__])
+        else:
+            _MP_CONTEXT = multiprocessing.get_context()
+    return _MP_CONTEXT
+
+
+# Options of the batch a worker process is serving, set once by _worker_init
+# so each task only has to carry its two paths, and the IMAGE_BACKENDS
+# module that processes them
+_WORKER_OPTIONS: Dict[str, Any] = {}
+_WORKER_BACKEND = image_processor
+
+
+def _worker_init(
     border_thickness: Optional[int],
     border_color: str,
     saturation: Optional[int],
-    watermarks: Optional[List[dict]]
-) -> dict:
+    watermarks: Optional[List[dict]],
+    shared_watermarks: Optional[List[dict]] = None,
+    image_backend: str = "wand"
+) -> None:
+    """
+    Initializer for parallel workers, run once in each worker.
+    
+    Stores the batch options for _process_image_worker and loads the
+    watermarks up front, so they are in this worker's watermark cache
+    before the first image arrives: from the shared memory published by
+    _share_watermarks() if possible, otherwise by decoding the files.
+    """
+    global _WORKER_BACKEND
+    _WORKER_BACKEND = backend = IMAGE_BACKENDS[image_backend]
+    if backend is vips_backend and multiprocessing.parent_process() is not None:
+        # Worker processes already run one image per core
+        vips_backend.use_single_thread()
+    _WORKER_OPTIONS.update(
+        border_thickness=border_thickness,
+        border_color=border_color,
+        saturation=saturation,
+        watermarks=watermarks,
+        # The batch scan only lists supported files, and the output folder
+        # is created before any image is processed
+        validated=True
+    )
+    for info in shared_watermarks or ():
+        try:
+            block = shared_memory.SharedMemory(name=info['shm_name'])
+            try:
+                pixels = bytes(block.buf[:info['size']])
+            finally:
+                block.close()
+            backend.preload_watermark(info['path'], info['mtime_ns'], pixels, info['width'], info['height'])
+        except Exception:
+            pass  # Decoded from the file instead
+    for wm in watermarks or ():
+        try:
+            backend.load_watermark(wm['path'])
+        except Exception:
+            pass  # Reported for each image by process_single_image
+
+
+def _process_image_worker(input_path: str, output_path: str) -> dict:
     """
     Worker function for parallel image processing.
     
-    This function runs in a separate process, so it must be defined at module level
-    and all arguments must be picklable (no complex objects).
+    This function runs in a worker process (or thread), so it must be defined at module level
+    and all arguments must be picklable (no complex objects). The processing
+    options come from _worker_init.
     
     Returns:
         dict with processing result (same format as process_single_image)
     """
-    return process_single_image(
+    return _WORKER_BACKEND.process_single_image(
         input_path=input_path,
         output_path=output_path,
-        border_thickness=border_thickness,
-        border_color=border_color,
-        saturation=saturation,
-        watermarks=watermarks
+        **_WORKER_OPTIONS
     )
 
 
-@dataclass
+def _process_image_chunk(paths: List[Tuple[str, str]]) -> List[dict]:
+    """
+    Worker function processing several (input_path, output_path) pairs in
+    one task. Returns their results in the same order.
+    """
+    return [_process_image_worker(input_path, output_path) for input_path, output_path in paths]
+
+
+def _share_watermarks(
+    watermarks: Optional[List[dict]],
+    image_backend: str = "wand"
+) -> Tuple[List[dict], List[shared_memory.SharedMemory]]:
+    """
+    Publish decoded watermark pixels in shared memory for worker processes.
+    
+    Each worker would otherwise decode the same watermark files itself.
+    The files are decoded with the batch's image backend, whose cache
+    already holds them from BatchProcessor._load_watermarks.
+    Watermarks smaller than SHARED_WATERMARK_MIN_BYTES (cheap to decode) or
+    that can't be read are left to the workers.
+    
+    Returns:
+        Tuple of (descriptions for _worker_init, shared memory blocks that
+        the caller must close and unlink once the workers have started)
+    """
+    shared: List[dict] = []
+    blocks: List[shared_memory.SharedMemory] = []
+    for path in {wm['path'] for wm in watermarks or ()}:
+        try:
+            pixels, width, height, mtime_ns = IMAGE_BACKENDS[image_backend].export_watermark(path)
+        except Exception:
+            continue
+        if len(pixels) < SHARED_WATERMARK_MIN_BYTES:
+            continue
+        
+        block = shared_memory.SharedMemory(create=True, size=len(pixels))
+        block.buf[:len(pixels)] = pixels
+        blocks.append(block)
+        shared.append({
+            'path': path,
+            'mtime_ns': mtime_ns,
+            'shm_name': block.name,
+            'size': len(pixels),
+            'width': width,
+            'height': height
+        })
+    return shared, blocks
+
+
+def _file_size(path: str) -> int:
+    """Get a file's size in bytes, or 0 if it can't be stat-ed."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _read_file(path: str) -> Optional[bytes]:
+    """
+    Read a whole file for prefetching.
+    
+    Returns None if the file can't be read; the image is then loaded from
+    its path as usual, so the error is reported the normal way.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _copy_image(input_path: str, output_path: str) -> dict:
+    """
+    Copy an image unchanged, for configs without image operations.
+    
+    Decoding and re-encoding would only cost time and (for JPEG) quality.
+    
+    Returns:
+        dict with processing result (same format as process_single_image)
+    """
+    result = {
+        "success": False,
+        "input_path": input_path,
+        "output_path": output_path,
+        "error": None
+    }
+    
+    try:
+        shutil.copyfile(input_path, output_path)
+        result["success"] = True
+    except shutil.SameFileError:
+        # Output is the input itself (same folder, no prefix/suffix)
+        result["success"] = True
+    except PermissionError as e:
+        result["error"] = f"Permission denied: {str(e)}"
+    except OSError as e:
+        result["error"] = f"Copy failed: {type(e).__name__}: {str(e)}"
+    
+    return result
+
+
+def find_image_files(folder: str) -> List[str]:
+    """
+    Find all supported image files in a folder (non-recursive).
+    
+    This is the list a batch of the folder processes; it can be passed to
+    process_folder(file_list=...) so the folder isn't listed a second time.
+    
+    Returns list of full paths to image files, sorted alphabetically.
+    """
+    return sorted(_iter_image_files(folder))
+
+
+def _iter_image_files(folder: str) -> Iterator[str]:
+    """
+    Yield full paths of supported image files in a folder (non-recursive).
+    
+    Paths are yielded in directory order while the folder is being read,
+    so callers can report progress before a large folder is fully listed.
+    """
+    try:
+        # scandir returns the file type with the directory listing, so
+        # is_file() needs no extra stat per entry (unlike os.path.isfile).
+        # The extension is checked first, inline on the bare name; dot > 0
+        # treats dotfiles like ".jpg" as having no extension, as splitext does.
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in SUPPORTED_FORMATS and entry.is_file():
+                    yield entry.path
+    except PermissionError:
+        return
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class WatermarkConfig:
     """Configuration for a single watermark."""
     path: str = ""
@@ -102,9 +343,10 @@ class WatermarkConfig:
     def validate(self) -> List[str]:
         """Validate this watermark config."""
         errors = []
-        if self.path and not os.path.isfile(self.path):
-            errors.append(f"Watermark file not found: {self.path}")
-        if self.position not in WATERMARK_POSITIONS:
+        if self.path:
+            if not os.path.isfile(self.path):
+                errors.append(f"Watermark file not found: {self.path}")
+        if self.position not in _WATERMARK_POSITION_SET:
             errors.append(f"Invalid watermark position: {self.position}")
         if not (0.0 <= self.opacity <= 1.0):
             errors.append("Watermark opacity must be between 0.0 and 1.0")
@@ -113,17 +355,42 @@ class WatermarkConfig:
         return errors
 
 
-class ProcessingState(Enum):
-    """Current state of the batch processor."""
-    IDLE = "idle"
-    RUNNING = "running"
-    PAUSED = "paused"
-    CANCELLED = "cancelled"
-    COMPLETED = "completed"
-    ERROR = "error"
+# Pool classes for parallel processing, keyed by ProcessingConfig.executor_kind
+EXECUTOR_KINDS = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+
+# Modules implementing process_single_image, load_watermark and
+# preload_watermark, keyed by ProcessingConfig.image_backend
+IMAGE_BACKENDS = {
+    "wand": image_processor,
+    "vips": vips_backend,
+}
+
+
+class ProcessingState:
+    """
+    Current state of the batch processor.
+    
+    Plain int constants rather than an Enum: the state is compared on every
+    progress update, and int comparisons are the cheapest. to_dict() sends
+    the matching name from _STATE_NAMES to the frontend.
+    """
+    IDLE = 0
+    RUNNING = 1
+    PAUSED = 2
+    CANCELLED = 3
+    COMPLETED = 4
+    ERROR = 5
+
+
+# Frontend names of the ProcessingState values, indexed by state
+_STATE_NAMES = ("idle", "running", "paused", "cancelled", "completed", "error")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """
     Configuration for batch image processing.
@@ -140,6 +407,18 @@ class ProcessingConfig:
         overwrite_existing: If True, overwrite files in output folder
         parallel_processing: If True, process images in parallel using multiple CPU cores
         max_workers: Number of parallel workers (0 = auto-detect based on CPU count)
+        executor_kind: Pool used for parallel processing: "process" (default) or
+            "thread". Threads avoid process startup and pickling and can win on
+            I/O-heavy batches, but they are an explicit opt-in: they drive
+            ImageMagick from several threads of the calling process at once
+            (alongside anything else using Wand there, such as previews),
+            share its watermark caches and worker options, and oversubscribe
+            the CPU when ImageMagick's own OpenMP threads kick in. A crash in
+            ImageMagick on a bad file then takes down the calling process
+            instead of one worker.
+        image_backend: Library that processes the images: "wand" (default) or
+            "vips", an explicit choice that needs pyvips. Previews are always
+            rendered with Wand; see vips_backend for how the two differ.
     """
     input_folder: str = ""
     output_folder: str = ""
@@ -152,6 +431,8 @@ class ProcessingConfig:
     overwrite_existing: bool = False
     parallel_processing: bool = True  # Enable parallel processing by default
     max_workers: int = 0  # 0 = auto-detect
+    executor_kind: str = "process"
+    image_backend: str = "wand"
     
     def validate(self) -> List[str]:
         """
@@ -177,6 +458,14 @@ class ProcessingConfig:
         if self.max_workers < 0:
             errors.append("Max workers cannot be negative")
         
+        if self.executor_kind not in EXECUTOR_KINDS:
+            errors.append(f"Invalid executor kind: {self.executor_kind}")
+        
+        if self.image_backend not in IMAGE_BACKENDS:
+            errors.append(f"Invalid image backend: {self.image_backend}")
+        elif self.image_backend == "vips" and not VIPS_AVAILABLE:
+            errors.append("The vips image backend requires pyvips and libvips to be installed")
+        
         # Validate each watermark
         for i, wm in enumerate(self.watermarks):
             wm_errors = wm.validate()
@@ -185,6 +474,36 @@ class ProcessingConfig:
             
         return errors
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dictionary (for settings and the frontend).
+        
+        Faster than dataclasses.asdict(), which deep-copies every field.
+        """
+        return {
+            "input_folder": self.input_folder,
+            "output_folder": self.output_folder,
+            "border_thickness": self.border_thickness,
+            "border_color": self.border_color,
+            "saturation": self.saturation,
+            "watermarks": [wm.to_dict() for wm in self.watermarks],
+            "filename_prefix": self.filename_prefix,
+            "filename_suffix": self.filename_suffix,
+            "overwrite_existing": self.overwrite_existing,
+            "parallel_processing": self.parallel_processing,
+            "max_workers": self.max_workers,
+            "executor_kind": self.executor_kind,
+            "image_backend": self.image_backend
+        }
+    
+    def has_image_operations(self) -> bool:
+        """Check whether any pixel operation (border, saturation, watermark) is configured."""
+        return (
+            self.border_thickness > 0
+            or self.saturation != 100
+            or any(wm.path for wm in self.watermarks)
+        )
+    
     def get_effective_workers(self) -> int:
         """Get the effective number of workers to use."""
         if not self.parallel_processing:
@@ -194,7 +513,7 @@ class ProcessingConfig:
         return self.max_workers
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingProgress:
     """
     Tracks progress of batch processing.
@@ -206,7 +525,9 @@ class ProcessingProgress:
         error_count: Number of files that had errors
         skipped_count: Number of files skipped (unsupported format, etc.)
         current_file: Name of the file currently being processed
-        errors: List of error details (file path + error message)
+        errors: List of error details (file path + error message), capped at
+            MAX_ERRORS entries; add them with add_error()
+        errors_truncated: Number of errors left out of errors because of the cap
         state: Current processing state
     """
     total_files: int = 0
@@ -216,7 +537,18 @@ class ProcessingProgress:
     skipped_count: int = 0
     current_file: str = ""
     errors: List[Dict[str, str]] = field(default_factory=list)
-    state: ProcessingState = ProcessingState.IDLE
+    errors_truncated: int = 0
+    state: int = ProcessingState.IDLE
+    
+    def add_error(self, file: str, error: str) -> None:
+        """
+        Record an error. Past MAX_ERRORS only the count is kept, so a batch
+        where most files fail can't grow the list (and its copies) unbounded.
+        """
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"file": file, "error": error})
+        else:
+            self.errors_truncated += 1
     
     @property
     def progress_percent(self) -> float:
@@ -225,9 +557,15 @@ class ProcessingProgress:
             return 0.0
         return (self.processed_count / self.total_files) * 100.0
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization (for frontend)."""
-        return {
+    def to_dict(self, include_errors: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization (for frontend).
+        
+        Args:
+            include_errors: Include the error details list. Progress ticks
+                only need error_count, and the list grows with the batch.
+        """
+        data = {
             "total_files": self.total_files,
             "processed_count": self.processed_count,
             "success_count": self.success_count,
@@ -235,9 +573,12 @@ class ProcessingProgress:
             "skipped_count": self.skipped_count,
             "current_file": self.current_file,
             "progress_percent": round(self.progress_percent, 1),
-            "errors": self.errors,
-            "state": self.state.value
+            "errors_truncated": self.errors_truncated,
+            "state": _STATE_NAMES[self.state]
         }
+        if include_errors:
+            data["errors"] = self.errors
+        return data
 
 
 class BatchProcessor:
@@ -253,33 +594,78 @@ class BatchProcessor:
     
     def __init__(self):
         self._config: Optional[ProcessingConfig] = None
+        # Input files given to start(), or None to scan the input folder
+        self._file_list: Optional[List[str]] = None
         self._progress = ProcessingProgress()
         self._cancel_requested = threading.Event()
         self._processing_thread: Optional[threading.Thread] = None
         self._progress_callback: Optional[Callable[[ProcessingProgress], None]] = None
         self._completion_callback: Optional[Callable[[ProcessingProgress], None]] = None
         self._lock = threading.Lock()
+        self._last_notify = 0.0  # time.monotonic() of the last progress callback
+        # Cached result of the progress property, rebuilt when _version changes
+        self._version = 0
+        self._snapshot = ProcessingProgress()
+        self._snapshot_version = 0
+        self._errors_snapshot: List[Dict[str, str]] = []
+        # Completion queue of the running pool; cancel() puts None in it to
+        # wake the batch thread right away
+        self._completed: Optional['queue.SimpleQueue[Optional[Future]]'] = None
+        # Progress callbacks run on their own thread during a batch, so a slow
+        # callback never holds up the scheduler. Only the newest progress waits
+        # in _queued_progress; older ones not yet delivered are dropped
+        self._callback_executor: Optional[ThreadPoolExecutor] = None
+        self._queued_progress: Optional[ProcessingProgress] = None
+        self._callback_lock = threading.Lock()
     
     @property
     def progress(self) -> ProcessingProgress:
-        """Get current progress (thread-safe copy)."""
+        """
+        Get current progress (thread-safe snapshot).
+        
+        The snapshot is cached and shared between callers until the progress
+        changes again, so it must be treated as read-only. The errors list is
+        only copied when new errors have been added.
+        """
+        # Lock-free fast path: pollers don't contend with the batch thread
+        # while nothing has changed. _snapshot is always assigned before
+        # _snapshot_version, so a matching version implies a current snapshot.
+        if self._snapshot_version == self._version:
+            return self._snapshot
+        
         with self._lock:
-            return ProcessingProgress(
-                total_files=self._progress.total_files,
-                processed_count=self._progress.processed_count,
-                success_count=self._progress.success_count,
-                error_count=self._progress.error_count,
-                skipped_count=self._progress.skipped_count,
-                current_file=self._progress.current_file,
-                errors=list(self._progress.errors),
-                state=self._progress.state
-            )
+            if self._snapshot_version != self._version:
+                progress = self._progress
+                if len(self._errors_snapshot) != len(progress.errors):
+                    self._errors_snapshot = list(progress.errors)
+                self._snapshot = ProcessingProgress(
+                    total_files=progress.total_files,
+                    processed_count=progress.processed_count,
+                    success_count=progress.success_count,
+                    error_count=progress.error_count,
+                    skipped_count=progress.skipped_count,
+                    current_file=progress.current_file,
+                    errors=self._errors_snapshot,
+                    errors_truncated=progress.errors_truncated,
+                    state=progress.state
+                )
+                self._snapshot_version = self._version
+            return self._snapshot
+    
+    @contextmanager
+    def _update_progress(self) -> Iterator[None]:
+        """Lock self._progress for modification and invalidate the cached snapshot."""
+        with self._lock:
+            try:
+                yield
+            finally:
+                self._version += 1
     
     @property
     def is_running(self) -> bool:
         """Check if processing is currently running."""
-        with self._lock:
-            return self._progress.state == ProcessingState.RUNNING
+        # A single attribute read is atomic; no need to take the lock
+        return self._progress.state == ProcessingState.RUNNING
     
     def set_progress_callback(self, callback: Callable[[ProcessingProgress], None]) -> None:
         """Set callback function to receive progress updates."""
@@ -289,44 +675,88 @@ class BatchProcessor:
         """Set callback function called when processing completes."""
         self._completion_callback = callback
     
-    def _notify_progress(self) -> None:
-        """Notify progress callback with current progress."""
+    def _notify_progress(self, force: bool = False) -> None:
+        """
+        Notify progress callback with current progress.
+        
+        While running, updates are throttled to one per PROGRESS_NOTIFY_INTERVAL
+        so large batches don't copy and send progress for every single file.
+        State changes (completed, cancelled, error) are always delivered.
+        
+        Args:
+            force: Notify even if the last update was sent within the interval
+        """
         if self._progress_callback:
-            try:
-                self._progress_callback(self.progress)
-            except Exception:
-                pass  # Don't let callback errors stop processing
+            now = time.monotonic()
+            if (not force and self._progress.state == ProcessingState.RUNNING
+                    and now - self._last_notify < PROGRESS_NOTIFY_INTERVAL):
+                return
+            self._last_notify = now
+            
+            if self._callback_executor is None:
+                self._deliver_progress(self.progress)
+                return
+            
+            with self._callback_lock:
+                delivery_pending = self._queued_progress is not None
+                self._queued_progress = self.progress
+            if not delivery_pending:
+                self._callback_executor.submit(self._deliver_progress)
     
-    def _find_image_files(self, folder: str) -> List[str]:
+    def _deliver_progress(self, progress: Optional[ProcessingProgress] = None) -> None:
         """
-        Find all supported image files in a folder (non-recursive).
-        
-        Returns list of full paths to image files, sorted alphabetically.
+        Call the progress callback with progress, or with the queued progress
+        when run on the callback thread.
         """
-        files = []
+        if progress is None:
+            with self._callback_lock:
+                progress, self._queued_progress = self._queued_progress, None
+        if progress is None or not self._progress_callback:
+            return
         try:
-            for filename in os.listdir(folder):
-                filepath = os.path.join(folder, filename)
-                if os.path.isfile(filepath) and is_supported_format(filepath):
-                    files.append(filepath)
-        except PermissionError:
-            pass
-        
-        return sorted(files)
+            self._progress_callback(progress)
+        except Exception:
+            pass  # Don't let callback errors stop processing
     
-    def _generate_output_path(self, input_path: str, config: ProcessingConfig) -> str:
+    @staticmethod
+    def _iter_outputs(
+        image_files: List[str],
+        config: ProcessingConfig
+    ) -> Iterator[Tuple[str, str, str, str]]:
         """
-        Generate the output path for a processed image.
+        Generate the output paths for processed images.
+        
+        Applies prefix/suffix to each filename and uses the output folder.
+        The config parts are resolved once for the whole batch.
         
-        Applies prefix/suffix to filename and uses output folder.
+        Yields:
+            (input_path, filename, output_path, output_key) per input file,
+            where output_key is the normcase()d output filename used to
+            look it up in the existing outputs (see _output_exists)
         """
-        filename = os.path.basename(input_path)
-        name, ext = os.path.splitext(filename)
+        output_dir = os.path.join(config.output_folder, "")
+        prefix = config.filename_prefix
+        suffix = config.filename_suffix
+        normcase = os.path.normcase
         
-        # Apply prefix and suffix
-        new_name = f"{config.filename_prefix}{name}{config.filename_suffix}{ext}"
+        for input_path in image_files:
+            filename = os.path.basename(input_path)
+            # Inputs always have a supported extension after a non-empty name
+            dot = filename.rfind(".")
+            new_name = f"{prefix}{filename[:dot]}{suffix}{filename[dot:]}"
+            yield input_path, filename, output_dir + new_name, normcase(new_name)
+    
+    @staticmethod
+    def _output_exists(output_key: str, existing_outputs: Optional[Set[str]]) -> bool:
+        """
+        Check whether an output must be skipped because it already exists.
         
-        return os.path.join(config.output_folder, new_name)
+        Args:
+            output_key: normcase()d output filename from _iter_outputs
+            existing_outputs: normcase()d names in the output folder,
+                or None if existing files may be overwritten
+        """
+        return existing_outputs is not None and output_key in existing_outputs
     
     def _process_batch(self) -> None:
         """
@@ -338,52 +768,89 @@ class BatchProcessor:
         if not config:
             return
         
+        self._last_notify = 0.0
+        self._callback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BatchProgress")
+        
+        # Everything alive now (modules, UI state) outlives the batch. Freezing
+        # it keeps the garbage collector from rescanning those objects in every
+        # collection triggered by the batch's short-lived per-file allocations.
+        gc.freeze()
+        
         try:
             # Create output folder if it doesn't exist
             os.makedirs(config.output_folder, exist_ok=True)
             
-            # Find all image files
-            image_files = self._find_image_files(config.input_folder)
+            if self._file_list is not None:
+                # Already listed by the caller
+                image_files = self._file_list
+            else:
+                # Find all image files. The UI hears about the scan right away and
+                # sees the count grow (throttled), instead of waiting on the listing.
+                with self._update_progress():
+                    self._progress.current_file = "Scanning input folder..."
+                self._notify_progress(force=True)
+                
+                image_files = []
+                for path in _iter_image_files(config.input_folder):
+                    image_files.append(path)
+                    if len(image_files) % SCAN_PROGRESS_STEP == 0:
+                        with self._update_progress():
+                            self._progress.total_files = len(image_files)
+                        self._notify_progress()
+                image_files.sort()
             
-            with self._lock:
+            with self._update_progress():
                 self._progress.total_files = len(image_files)
+                self._progress.current_file = ""
                 self._progress.state = ProcessingState.RUNNING
             self._notify_progress()
             
             if not image_files:
-                with self._lock:
+                with self._update_progress():
                     self._progress.state = ProcessingState.COMPLETED
                 self._notify_progress()
                 return
             
-            # Prepare watermarks data (must be picklable for multiprocessing)
-            watermarks_data = []
-            for wm in config.watermarks:
-                if wm.path:
-                    watermarks_data.append({
-                        'path': wm.path,
-                        'position': wm.position,
-                        'opacity': wm.opacity,
-                        'scale': wm.scale,
-                        'margin': wm.margin
-                    })
-            watermarks_data = watermarks_data if watermarks_data else None
+            # Prepare watermarks data once per batch (plain dicts are picklable
+            # for multiprocessing); every image shares the same list
+            watermarks_data = [wm.to_dict() for wm in config.watermarks if wm.path] or None
+            
+            # Decode the watermarks now, with the backend that will use them,
+            # so a broken file fails the batch once instead of every image
+            error = self._load_watermarks(watermarks_data, config.image_backend)
+            if error:
+                with self._update_progress():
+                    self._progress.state = ProcessingState.ERROR
+                    self._progress.errors.append({"file": "WATERMARK", "error": error})
+                self._notify_progress()
+                return
+            
+            # Names already in the output folder, listed once instead of
+            # stat-ing every output path (None = overwriting, no check needed)
+            existing_outputs = None
+            if not config.overwrite_existing:
+                existing_outputs = {os.path.normcase(name) for name in os.listdir(config.output_folder)}
             
             # Get effective number of workers
             num_workers = config.get_effective_workers()
             
-            if num_workers > 1:
+            if not config.has_image_operations():
+                # Nothing to do to the pixels: files are copied as-is, which is
+                # disk-bound work that a process pool can't speed up
+                self._process_sequential(image_files, config, watermarks_data, existing_outputs)
+            elif num_workers > 1:
                 # Parallel processing
                 self._process_parallel(
-                    image_files, config, watermarks_data, num_workers
+                    image_files, config, watermarks_data, existing_outputs, num_workers
                 )
             else:
                 # Sequential processing (original behavior)
-                self._process_sequential(image_files, config, watermarks_data)
+                self._process_sequential(image_files, config, watermarks_data, existing_outputs)
             
         except Exception as e:
-            with self._lock:
+            with self._update_progress():
                 self._progress.state = ProcessingState.ERROR
+                # Appended past the cap: the fatal error must always be reported
                 self._progress.errors.append({
                     "file": "BATCH",
                     "error": f"Fatal error: {type(e).__name__}: {str(e)}"
@@ -391,239 +858,343 @@ class BatchProcessor:
             self._notify_progress()
         
         finally:
+            gc.unfreeze()
+            # Deliver the last progress before the batch counts as finished
+            self._callback_executor.shutdown(wait=True)
+            self._callback_executor = None
             if self._completion_callback:
                 try:
                     self._completion_callback(self.progress)
                 except Exception:
                     pass
     
+    @staticmethod
+    def _load_watermarks(watermarks_data: Optional[List[dict]], image_backend: str) -> Optional[str]:
+        """
+        Load a batch's watermarks into this process's watermark cache.
+        
+        Runs on the batch thread. Process pools then share the decoded
+        pixels with their workers (see _share_watermarks).
+        
+        Returns:
+            Error message for the first watermark that can't be decoded, or None
+        """
+        backend = IMAGE_BACKENDS[image_backend]
+        for wm in watermarks_data or ():
+            try:
+                backend.load_watermark(wm['path'])
+            except Exception as e:
+                return f"Watermark file could not be read: {wm['path']} ({e})"
+        return None
+    
     def _process_sequential(
         self,
         image_files: List[str],
         config: ProcessingConfig,
-        watermarks_data: Optional[List[dict]]
+        watermarks_data: Optional[List[dict]],
+        existing_outputs: Optional[Set[str]]
     ) -> None:
-        """Process images one-by-one (sequential mode)."""
-        for input_path in image_files:
-            # Check for cancellation
-            if self._cancel_requested.is_set():
-                with self._lock:
-                    self._progress.state = ProcessingState.CANCELLED
-                self._notify_progress()
-                return
-            
-            filename = os.path.basename(input_path)
-            with self._lock:
-                self._progress.current_file = filename
-            self._notify_progress()
-            
-            # Generate output path
-            output_path = self._generate_output_path(input_path, config)
-            
-            # Check if output exists and overwrite is disabled
-            if os.path.exists(output_path) and not config.overwrite_existing:
-                with self._lock:
-                    self._progress.skipped_count += 1
-                    self._progress.processed_count += 1
-                    self._progress.errors.append({
-                        "file": filename,
-                        "error": "Output file already exists (overwrite disabled)"
-                    })
-                continue
-            
-            # Process the image
-            result = process_single_image(
-                input_path=input_path,
-                output_path=output_path,
-                border_thickness=config.border_thickness if config.border_thickness > 0 else None,
-                border_color=config.border_color,
-                saturation=config.saturation if config.saturation != 100 else None,
-                watermarks=watermarks_data
-            )
+        """
+        Process images one-by-one (sequential mode).
+        
+        If the config has no image operations, files are copied unchanged
+        instead of being decoded and re-encoded.
+        """
+        # Config is constant for the whole batch
+        border_thickness = config.border_thickness if config.border_thickness > 0 else None
+        saturation = config.saturation if config.saturation != 100 else None
+        copy_only = not config.has_image_operations()
+        process_image = IMAGE_BACKENDS[config.image_backend].process_single_image
+        
+        outputs = list(self._iter_outputs(image_files, config))
+        
+        # While one image is decoded and processed, the next one is read from
+        # disk on a helper thread, so storage latency overlaps with CPU work
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="Prefetch") as reader:
+            prefetched: Optional[Future] = None
             
-            with self._lock:
-                self._progress.processed_count += 1
-                if result["success"]:
-                    self._progress.success_count += 1
+            for index, (input_path, filename, output_path, output_key) in enumerate(outputs):
+                # Check for cancellation
+                if self._cancel_requested.is_set():
+                    with self._update_progress():
+                        self._progress.state = ProcessingState.CANCELLED
+                    self._notify_progress()
+                    return
+                
+                read_future, prefetched = prefetched, None
+                
+                # Check if output exists and overwrite is disabled
+                if self._output_exists(output_key, existing_outputs):
+                    with self._update_progress():
+                        self._progress.skipped_count += 1
+                        self._progress.processed_count += 1
+                        self._progress.current_file = filename
+                        self._progress.add_error(filename, "Output file already exists (overwrite disabled)")
+                    continue
+                
+                if copy_only:
+                    result = _copy_image(input_path, output_path)
                 else:
-                    self._progress.error_count += 1
-                    self._progress.errors.append({
-                        "file": filename,
-                        "error": result["error"]
-                    })
-            
-            self._notify_progress()
+                    # Start reading the next file unless it is going to be skipped
+                    next_index = index + 1
+                    if (next_index < len(outputs)
+                            and not self._output_exists(outputs[next_index][3], existing_outputs)):
+                        prefetched = reader.submit(_read_file, outputs[next_index][0])
+                    
+                    # Process the image
+                    result = process_image(
+                        input_path=input_path,
+                        output_path=output_path,
+                        border_thickness=border_thickness,
+                        border_color=config.border_color,
+                        saturation=saturation,
+                        watermarks=watermarks_data,
+                        input_bytes=read_future.result() if read_future else None,
+                        validated=True
+                    )
+                
+                if result["success"] and existing_outputs is not None:
+                    # Later files must not overwrite this output either
+                    existing_outputs.add(output_key)
+                
+                # All of this file's progress changes in one critical section
+                with self._update_progress():
+                    self._progress.processed_count += 1
+                    self._progress.current_file = filename
+                    if result["success"]:
+                        self._progress.success_count += 1
+                    else:
+                        self._progress.error_count += 1
+                        self._progress.add_error(filename, result["error"])
+                
+                self._notify_progress()
         
         # Mark as completed
-        with self._lock:
+        with self._update_progress():
             self._progress.current_file = ""
             self._progress.state = ProcessingState.COMPLETED
         self._notify_progress()
     
+    def _iter_tasks(
+        self,
+        image_files: List[str],
+        config: ProcessingConfig,
+        existing_outputs: Optional[Set[str]]
+    ) -> Iterator[tuple]:
+        """
+        Yield (input_path, output_path, filename) for every file to process,
+        recording files that are skipped as they come up.
+        """
+        for input_path, filename, output_path, output_key in self._iter_outputs(image_files, config):
+            # Check if output exists and overwrite is disabled
+            if self._output_exists(output_key, existing_outputs):
+                with self._update_progress():
+                    self._progress.skipped_count += 1
+                    self._progress.processed_count += 1
+                    self._progress.add_error(filename, "Output file already exists (overwrite disabled)")
+                self._notify_progress()
+                continue
+            
+            yield input_path, output_path, filename
+    
     def _process_parallel(
         self,
         image_files: List[str],
         config: ProcessingConfig,
         watermarks_data: Optional[List[dict]],
+        existing_outputs: Optional[Set[str]],
         num_workers: int
     ) -> None:
         """
-        Process images in parallel using ProcessPoolExecutor.
+        Process images in parallel using the pool chosen by config.executor_kind.
         
         Optimized for large batches (300-400+ images):
         - Uses chunked task submission to limit memory usage
         - Maintains a sliding window of active tasks (2x workers)
         - Processes results as they complete for smooth progress updates
+        - Hands out the largest files first, so the batch doesn't end with a
+          few large images running while the other workers sit idle
         """
-        # Pre-filter files that would be skipped
-        tasks = []
-        for input_path in image_files:
-            output_path = self._generate_output_path(input_path, config)
-            filename = os.path.basename(input_path)
-            
-            # Check if output exists and overwrite is disabled
-            if os.path.exists(output_path) and not config.overwrite_existing:
-                with self._lock:
-                    self._progress.skipped_count += 1
-                    self._progress.processed_count += 1
-                    self._progress.errors.append({
-                        "file": filename,
-                        "error": "Output file already exists (overwrite disabled)"
-                    })
-                self._notify_progress()
-            else:
-                tasks.append((input_path, output_path, filename))
+        executor_kind = config.executor_kind
+        
+        # Longest job first: file size stands in for processing time. The sort
+        # is stable, so files of equal size stay in alphabetical order
+        image_files = sorted(image_files, key=_file_size, reverse=True)
+        
+        # Files that would be skipped are filtered out (and recorded) lazily,
+        # as the pool asks for more work
+        tasks = self._iter_tasks(image_files, config, existing_outputs)
+        first_task = next(tasks, None)
         
-        if not tasks:
-            with self._lock:
+        if first_task is None:
+            with self._update_progress():
                 self._progress.current_file = ""
                 self._progress.state = ProcessingState.COMPLETED
             self._notify_progress()
             return
+        tasks = itertools.chain((first_task,), tasks)
         
         # Update current file to show parallel processing
-        with self._lock:
-            self._progress.current_file = f"Processing {len(tasks)} images with {num_workers} workers..."
-        self._notify_progress()
+        with self._update_progress():
+            self._progress.current_file = f"Processing images with {num_workers} workers..."
+        self._notify_progress(force=True)
         
-        # Process in parallel using ProcessPoolExecutor
+        # Process in parallel using a process (or thread) pool
         border_thickness = config.border_thickness if config.border_thickness > 0 else None
         saturation = config.saturation if config.saturation != 100 else None
         
+        # Worker processes get the decoded watermarks through shared memory;
+        # threads already share this process's watermark cache
+        shared_watermarks, shared_blocks = [], []
+        if executor_kind == "process":
+            shared_watermarks, shared_blocks = _share_watermarks(watermarks_data, config.image_backend)
+        
+        # Worker processes take a few images per task to amortize IPC;
+        # threads have no IPC to save, so they go one image at a time
+        chunk_size = 1
+        if executor_kind == "process":
+            chunk_size = max(1, min(MAX_TASK_CHUNK, len(image_files) // (num_workers * 8)))
+        
+        try:
+            self._run_pool(
+                tasks, executor_kind, num_workers, chunk_size,
+                (border_thickness, config.border_color, saturation, watermarks_data, shared_watermarks,
+                 config.image_backend)
+            )
+        finally:
+            for block in shared_blocks:
+                block.close()
+                block.unlink()
+    
+    def _run_pool(
+        self,
+        tasks: Iterator[tuple],
+        executor_kind: str,
+        num_workers: int,
+        chunk_size: int,
+        worker_args: tuple
+    ) -> None:
+        """
+        Run the (input_path, output_path, filename) tasks on a worker pool of
+        the given EXECUTOR_KINDS kind and record their results, sending
+        chunk_size tasks to a worker at a time. worker_args are the arguments
+        of _worker_init.
+        """
         # For large batches, use chunked submission to limit memory usage
-        # Keep at most 2x workers worth of tasks pending at any time
+        # Keep at most 2x workers worth of chunks pending at any time
         max_pending = num_workers * 2
+        chunks = iter(lambda: list(itertools.islice(tasks, chunk_size)), [])
         
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            future_to_file: Dict[Future, tuple] = {}
-            task_iter = iter(tasks)
-            tasks_submitted = 0
-            tasks_total = len(tasks)
+        # Futures report completion through a queue that the batch thread
+        # blocks on, instead of building an as_completed() waiter over every
+        # pending future for each result. A new queue per batch, so callbacks
+        # of futures cancelled in an earlier batch can't end up in this one
+        completed: 'queue.SimpleQueue[Optional[Future]]' = queue.SimpleQueue()
+        self._completed = completed
+        
+        executor_class = EXECUTOR_KINDS[executor_kind]
+        executor_options: Dict[str, Any] = {}
+        if executor_class is ProcessPoolExecutor:
+            executor_options["mp_context"] = _get_mp_context()
+        
+        with executor_class(
+            max_workers=num_workers,
+            initializer=_worker_init,
+            initargs=worker_args,
+            **executor_options
+        ) as executor:
+            future_to_files: Dict[Future, List[str]] = {}
+            
+            def submit(chunk: List[tuple]) -> None:
+                if chunk_size == 1:
+                    input_path, output_path, _ = chunk[0]
+                    future = executor.submit(_process_image_worker, input_path, output_path)
+                else:
+                    paths = [(input_path, output_path) for input_path, output_path, _ in chunk]
+                    future = executor.submit(_process_image_chunk, paths)
+                future_to_files[future] = [filename for _, _, filename in chunk]
+                future.add_done_callback(completed.put)
             
             # Initial batch submission
-            for _ in range(min(max_pending, tasks_total)):
-                if self._cancel_requested.is_set():
-                    break
-                try:
-                    input_path, output_path, filename = next(task_iter)
-                    future = executor.submit(
-                        _process_image_worker,
-                        input_path,
-                        output_path,
-                        border_thickness,
-                        config.border_color,
-                        saturation,
-                        watermarks_data
-                    )
-                    future_to_file[future] = (input_path, output_path, filename)
-                    tasks_submitted += 1
-                except StopIteration:
-                    break
+            for chunk in itertools.islice(chunks, max_pending):
+                submit(chunk)
             
             # Process results and submit new tasks as slots become available
-            while future_to_file:
+            while future_to_files:
                 # Check for cancellation before waiting
                 if self._cancel_requested.is_set():
                     # Cancel remaining futures
-                    for f in future_to_file:
+                    for f in future_to_files:
                         f.cancel()
                     executor.shutdown(wait=False, cancel_futures=True)
-                    with self._lock:
+                    with self._update_progress():
                         self._progress.state = ProcessingState.CANCELLED
                     self._notify_progress()
                     return
                 
-                # Wait for the next completed future (with short timeout for cancellation responsiveness)
+                # Wait for the next completed future; cancel() wakes this up
+                # with a None, the timeout is only a safety net
                 try:
-                    # Use a copy of keys to avoid dict modification during iteration
-                    completed_iter = as_completed(list(future_to_file.keys()), timeout=1.0)
-                    future = next(completed_iter)
-                except FuturesTimeoutError:
+                    done = [completed.get(timeout=1.0)]
+                except queue.Empty:
                     # Timeout - loop again to check cancellation
                     continue
-                except StopIteration:
-                    # No more futures
-                    break
                 
-                input_path, output_path, filename = future_to_file.pop(future)
+                # Take every other result that is already in, so results that
+                # finish together share one critical section and one notification
+                while True:
+                    try:
+                        done.append(completed.get_nowait())
+                    except queue.Empty:
+                        break
+                done = [future for future in done if future is not None]
+                if not done:
+                    continue  # Woken up by cancel()
                 
-                try:
-                    result = future.result()
-                    
-                    with self._lock:
-                        self._progress.processed_count += 1
-                        self._progress.current_file = filename
-                        if result["success"]:
-                            self._progress.success_count += 1
-                        else:
-                            self._progress.error_count += 1
-                            self._progress.errors.append({
-                                "file": filename,
-                                "error": result["error"]
-                            })
-                    
-                    self._notify_progress()
-                    
-                except Exception as e:
-                    with self._lock:
-                        self._progress.processed_count += 1
-                        self._progress.error_count += 1
-                        self._progress.errors.append({
-                            "file": filename,
-                            "error": f"Worker error: {type(e).__name__}: {str(e)}"
-                        })
-                    self._notify_progress()
+                with self._update_progress():
+                    for future in done:
+                        filenames = future_to_files.pop(future)
+                        try:
+                            results = future.result()
+                            if chunk_size == 1:
+                                results = [results]
+                        except Exception as e:
+                            results = [{
+                                "success": False,
+                                "error": f"Worker error: {type(e).__name__}: {str(e)}"
+                            }] * len(filenames)
+                        
+                        for filename, result in zip(filenames, results):
+                            self._progress.processed_count += 1
+                            self._progress.current_file = filename
+                            if result["success"]:
+                                self._progress.success_count += 1
+                            else:
+                                self._progress.error_count += 1
+                                self._progress.add_error(filename, result["error"])
                 
-                # Submit a new task if there are more
-                if tasks_submitted < tasks_total and not self._cancel_requested.is_set():
-                    try:
-                        input_path, output_path, filename = next(task_iter)
-                        new_future = executor.submit(
-                            _process_image_worker,
-                            input_path,
-                            output_path,
-                            border_thickness,
-                            config.border_color,
-                            saturation,
-                            watermarks_data
-                        )
-                        future_to_file[new_future] = (input_path, output_path, filename)
-                        tasks_submitted += 1
-                    except StopIteration:
-                        pass
+                self._notify_progress()
+                
+                # Submit a new chunk for each finished one, if there are more
+                if not self._cancel_requested.is_set():
+                    for chunk in itertools.islice(chunks, len(done)):
+                        submit(chunk)
         
         # Mark as completed
-        with self._lock:
+        with self._update_progress():
             self._progress.current_file = ""
             self._progress.state = ProcessingState.COMPLETED
         self._notify_progress()
     
-    def start(self, config: ProcessingConfig) -> Optional[str]:
+    def start(self, config: ProcessingConfig, file_list: Optional[List[str]] = None) -> Optional[str]:
         """
         Start batch processing with the given configuration.
         
         Args:
             config: Processing configuration
+            file_list: Image files to process instead of scanning
+                config.input_folder (e.g. from find_image_files()). Files
+                with unsupported extensions are ignored.
             
         Returns:
             Error message if cannot start, None if started successfully
@@ -638,11 +1209,15 @@ class BatchProcessor:
             return "Processing is already running"
         
         # Reset state
-        with self._lock:
+        with self._update_progress():
             self._progress = ProcessingProgress()
             self._progress.state = ProcessingState.RUNNING
+            self._errors_snapshot = []
         
         self._config = config
+        self._file_list = None
+        if file_list is not None:
+            self._file_list = sorted(path for path in file_list if is_supported_format(path))
         self._cancel_requested.clear()
         
         # Start processing in background thread
@@ -658,6 +1233,9 @@ class BatchProcessor:
     def cancel(self) -> None:
         """Request cancellation of current processing."""
         self._cancel_requested.set()
+        completed = self._completed
+        if completed is not None:
+            completed.put(None)
     
     def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """
@@ -685,7 +1263,10 @@ def process_folder(
     watermarks: Optional[List[WatermarkConfig]] = None,
     progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
     parallel_processing: bool = True,
-    max_workers: int = 0
+    max_workers: int = 0,
+    executor_kind: str = "process",
+    image_backend: str = "wand",
+    file_list: Optional[List[str]] = None
 ) -> ProcessingProgress:
     """
     Process all images in a folder (blocking/synchronous).
@@ -702,6 +1283,10 @@ def process_folder(
         progress_callback: Optional callback for progress updates
         parallel_processing: If True, process images in parallel (default: True)
         max_workers: Number of parallel workers (0 = auto-detect based on CPU count)
+        executor_kind: "process" (default) or "thread" pool for parallel processing
+        image_backend: "wand" (default) or "vips" library for processing
+        file_list: Image files to process, if already listed (see
+            find_image_files()); None to scan input_folder
         
     Returns:
         Final ProcessingProgress with results
@@ -714,18 +1299,20 @@ def process_folder(
         saturation=saturation,
         watermarks=watermarks or [],
         parallel_processing=parallel_processing,
-        max_workers=max_workers
+        max_workers=max_workers,
+        executor_kind=executor_kind,
+        image_backend=image_backend
     )
     
     processor = BatchProcessor()
     if progress_callback:
         processor.set_progress_callback(progress_callback)
     
-    error = processor.start(config)
+    error = processor.start(config, file_list)
     if error:
         progress = ProcessingProgress()
         progress.state = ProcessingState.ERROR
-        progress.errors.append({"file": "CONFIG", "error": error})
+        progress.add_error("CONFIG", error)
         return progress
     
     processor.wait_for_completion()
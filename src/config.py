@@ -6,13 +6,47 @@ Settings are stored as JSON in the user's app data directory.
 """
 
 import os
+import copy
 import json
-from typing import Dict, Any, Optional
-from dataclasses import asdict
+import functools
+import tempfile
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 
-from .batch_processor import ProcessingConfig, WatermarkConfig
+# batch_processor imports Wand/ImageMagick, so it is only imported where a
+# config object is actually built. Plain settings access stays lightweight.
+if TYPE_CHECKING:
+    from .batch_processor import ProcessingConfig
 
 
+# orjson (optional) parses and writes the settings files faster than the
+# json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON file contents, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data to indented JSON file contents, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# Parsed settings.json and the (mtime_ns, size) it was read at, so unchanged
+# settings aren't re-read and re-parsed by every helper that needs them.
+# Callers always get a copy, since they modify the dict before saving it.
+_SETTINGS_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> str:
     """
     Get the application configuration directory.
@@ -21,6 +55,10 @@ def get_config_dir() -> str:
     - Windows: %APPDATA%/RKC-Photography
     - macOS: ~/Library/Application Support/RKC-Photography
     - Linux: ~/.config/RKC-Photography
+    
+    Resolved (and created) once per process, like the file paths built on
+    it; clear their caches (e.g. get_config_dir.cache_clear()) after changing
+    the environment they depend on.
     """
     if os.name == 'nt':  # Windows
         base = os.environ.get('APPDATA', os.path.expanduser('~'))
@@ -37,51 +75,153 @@ def get_config_dir() -> str:
     return config_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_file() -> str:
     """Get the path to the main configuration file."""
     return os.path.join(get_config_dir(), 'settings.json')
 
 
+@functools.lru_cache(maxsize=1)
+def get_dependency_cache_file() -> str:
+    """
+    Get the path to the dependency check cache.
+    
+    Kept separate from settings.json so clearing settings on exit
+    does not force the ImageMagick probe to run again.
+    """
+    return os.path.join(get_config_dir(), 'deps.json')
+
+
+def load_dependency_cache() -> Dict[str, Any]:
+    """
+    Load the cached result of the last successful dependency check.
+    
+    Returns empty dict if no check has been cached yet or the file is invalid.
+    """
+    cache_file = get_dependency_cache_file()
+    
+    if not os.path.exists(cache_file):
+        return {}
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            data = _loads_json(f.read())
+        return data if isinstance(data, dict) else {}
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+
+def save_dependency_cache(data: Dict[str, Any]) -> bool:
+    """
+    Save the result of a successful dependency check.
+    
+    Returns True if successful, False otherwise.
+    """
+    try:
+        with open(get_dependency_cache_file(), 'wb') as f:
+            f.write(_dumps_json(data))
+        return True
+    except IOError:
+        return False
+
+
 def load_settings() -> Dict[str, Any]:
     """
     Load settings from the configuration file.
     
     Returns empty dict if file doesn't exist or is invalid.
+    The file is only parsed again after it has changed on disk.
     """
+    global _SETTINGS_CACHE
     config_file = get_config_file()
     
-    if not os.path.exists(config_file):
+    try:
+        stat = os.stat(config_file)
+    except OSError:
         return {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _SETTINGS_CACHE
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(config_file, 'rb') as f:
+            settings = _loads_json(f.read())
     except (json.JSONDecodeError, IOError):
         return {}
+    
+    _SETTINGS_CACHE = (signature, settings)
+    return copy.deepcopy(settings)
 
 
 def save_settings(settings: Dict[str, Any]) -> bool:
     """
     Save settings to the configuration file.
     
+    The settings are written to a temporary file that then replaces the
+    configuration file, so a crash mid-write can't leave it truncated.
+    
     Returns True if successful, False otherwise.
     """
+    global _SETTINGS_CACHE
     config_file = get_config_file()
     
+    # Encoded up front: a value that can't be serialized raises before any
+    # file is created
+    data = _dumps_json(settings)
+    
+    tmp_path = None
     try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2)
-        return True
+        fd, tmp_path = tempfile.mkstemp(dir=get_config_dir(), prefix='.settings.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, config_file)
     except IOError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        invalidate_settings_cache()
         return False
+    
+    # What was just written becomes the cached copy; no need to read it back
+    try:
+        stat = os.stat(config_file)
+        _SETTINGS_CACHE = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(settings))
+    except OSError:
+        invalidate_settings_cache()
+    return True
 
 
-def load_processing_config() -> ProcessingConfig:
+def update_settings(patch: Dict[str, Any]) -> bool:
+    """
+    Merge several settings into the configuration file at once.
+    
+    One load and one save, however many keys are changed.
+    
+    Returns True if successful, False otherwise.
+    """
+    settings = load_settings()
+    settings.update(patch)
+    return save_settings(settings)
+
+
+def invalidate_settings_cache() -> None:
+    """Forget the cached settings, so the next load reads the file again."""
+    global _SETTINGS_CACHE
+    _SETTINGS_CACHE = None
+
+
+def load_processing_config() -> 'ProcessingConfig':
     """
     Load processing configuration from settings.
     
     Returns default config if no saved settings.
     """
+    from .batch_processor import ProcessingConfig, WatermarkConfig
+    
     settings = load_settings()
     processing = settings.get('processing', {})
     
@@ -108,35 +248,19 @@ def load_processing_config() -> ProcessingConfig:
         filename_suffix=processing.get('filename_suffix', ''),
         overwrite_existing=processing.get('overwrite_existing', False),
         parallel_processing=processing.get('parallel_processing', True),
-        max_workers=processing.get('max_workers', 0)
+        max_workers=processing.get('max_workers', 0),
+        executor_kind=processing.get('executor_kind', 'process'),
+        image_backend=processing.get('image_backend', 'wand')
     )
 
 
-def save_processing_config(config: ProcessingConfig) -> bool:
+def save_processing_config(config: 'ProcessingConfig') -> bool:
     """
     Save processing configuration to settings.
     
     Preserves other settings in the file.
     """
-    settings = load_settings()
-    
-    # Convert config to dict, handling watermarks specially
-    config_dict = {
-        'input_folder': config.input_folder,
-        'output_folder': config.output_folder,
-        'border_thickness': config.border_thickness,
-        'border_color': config.border_color,
-        'saturation': config.saturation,
-        'watermarks': [wm.to_dict() for wm in config.watermarks],
-        'filename_prefix': config.filename_prefix,
-        'filename_suffix': config.filename_suffix,
-        'overwrite_existing': config.overwrite_existing,
-        'parallel_processing': config.parallel_processing,
-        'max_workers': config.max_workers
-    }
-    
-    settings['processing'] = config_dict
-    return save_settings(settings)
+    return update_settings({'processing': config.to_dict()})
 
 
 def get_recent_folders() -> Dict[str, str]:
@@ -153,13 +277,15 @@ def get_recent_folders() -> Dict[str, str]:
 
 
 def save_recent_folders(input_folder: str = '', output_folder: str = '') -> bool:
-    """Save recently used folders."""
-    settings = load_settings()
+    """Save recently used folders (both in a single write)."""
+    patch = {}
     if input_folder:
-        settings['recent_input_folder'] = input_folder
+        patch['recent_input_folder'] = input_folder
     if output_folder:
-        settings['recent_output_folder'] = output_folder
-    return save_settings(settings)
+        patch['recent_output_folder'] = output_folder
+    if not patch:
+        return True
+    return update_settings(patch)
 
 
 def clear_cache() -> bool:
@@ -172,6 +298,7 @@ def clear_cache() -> bool:
         True if cache was cleared successfully, False otherwise
     """
     config_file = get_config_file()
+    invalidate_settings_cache()
     
     try:
         if os.path.exists(config_file):
@@ -12,14 +12,21 @@ Design Decision: Using Wand instead of subprocess + CLI because:
 """
 
 import os
+import shutil
+import functools
+import threading
+from collections import OrderedDict
 from typing import Tuple, Optional, Literal, List
 from wand.image import Image
 from wand.color import Color
 from wand.exceptions import WandException
 
 
-# Supported image formats (lowercase extensions)
-SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'}
+# Supported image formats (lowercase extensions).
+# A frozenset: membership tests are O(1) and the set can't be mutated at runtime.
+SUPPORTED_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'})
+
+_PATH_SEPARATORS = os.sep + (os.altsep or '')
 
 
 def is_supported_format(filepath: str) -> bool:
@@ -32,8 +39,36 @@ def is_supported_format(filepath: str) -> bool:
     Returns:
         True if the file extension is supported, False otherwise
     """
-    ext = os.path.splitext(filepath)[1].lower()
-    return ext in SUPPORTED_FORMATS
+    # Called for every file of a batch: slice off the extension directly
+    # instead of having splitext() parse the whole path
+    filepath = os.fspath(filepath)
+    dot = filepath.rfind('.')
+    # A dot starting the file name marks a hidden file, not an extension
+    if dot <= 0 or filepath[dot - 1] in _PATH_SEPARATORS:
+        return False
+    return filepath[dot:].lower() in SUPPORTED_FORMATS
+
+
+# Rec. 601 luma weights of the red, green and blue channels
+_LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+@functools.lru_cache(maxsize=32)
+def saturation_matrix(saturation: int) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Get the 3x3 RGB color matrix for a saturation level (0-200).
+    
+    Each output pixel is blended between its luma gray and the original
+    color: gray + (color - gray) * saturation / 100. As a linear matrix,
+    this runs in a single pass over the pixels with no colorspace
+    conversions.
+    """
+    factor = saturation / 100.0
+    return tuple(
+        tuple((1.0 - factor) * weight + (factor if row == col else 0.0)
+              for col, weight in enumerate(_LUMA_WEIGHTS))
+        for row in range(3)
+    )
 
 
 def adjust_saturation(
@@ -43,6 +78,10 @@ def adjust_saturation(
     """
     Adjust the saturation of an image (in-place modification).
     
+    Colors are scaled away from (or towards) their luma gray with one color
+    matrix pass (see saturation_matrix), which is cheaper than modulate()'s
+    conversion to HSL and back.
+    
     Args:
         image: Wand Image object to modify
         saturation: Saturation level as percentage (0-200)
@@ -56,9 +95,16 @@ def adjust_saturation(
     if not (0 <= saturation <= 200):
         raise ValueError(f"Saturation must be between 0 and 200, got {saturation}")
     
-    # modulate() expects float percentages: brightness, saturation, hue
-    # 100.0 = no change for all three parameters
-    image.modulate(brightness=100.0, saturation=float(saturation), hue=100.0)
+    image.color_matrix([list(row) for row in saturation_matrix(saturation)])
+
+
+@functools.lru_cache(maxsize=16)
+def _get_color(color: str) -> Color:
+    """
+    Parse a color string once; a batch uses the same border color for every
+    image. The returned Color is shared and must not be modified.
+    """
+    return Color(color)
 
 
 def add_border(
@@ -81,8 +127,7 @@ def add_border(
     if thickness <= 0:
         raise ValueError(f"Border thickness must be positive, got {thickness}")
     
-    # Create border color
-    border_color = Color(color)
+    border_color = _get_color(color)
     
     # Add border using ImageMagick's border operation
     # This extends the image canvas and fills the new area with the border color
@@ -96,6 +141,118 @@ WATERMARK_POSITIONS = (
     "bottom-left", "bottom", "bottom-right"
 )
 
+# Horizontal and vertical alignment of each position: 0 = margin from the
+# start, 1 = centered, 2 = margin from the end (see watermark_origin)
+_POSITION_ALIGNMENT = {
+    "top-left": (0, 0), "top": (1, 0), "top-right": (2, 0),
+    "left": (0, 1), "center": (1, 1), "right": (2, 1),
+    "bottom-left": (0, 2), "bottom": (1, 2), "bottom-right": (2, 2),
+}
+
+
+def watermark_origin(
+    position: str,
+    width: int,
+    height: int,
+    watermark_width: int,
+    watermark_height: int,
+    margin: int
+) -> Tuple[int, int]:
+    """
+    Get the top-left corner (x, y) of a watermark placed on an image.
+    
+    The offset is computed from the position's alignment in one expression
+    per axis: margin at the start, centered, or margin from the end.
+    Negative offsets are clamped to 0.
+    
+    Raises:
+        ValueError: If position is not one of WATERMARK_POSITIONS
+    """
+    try:
+        h_align, v_align = _POSITION_ALIGNMENT[position]
+    except KeyError:
+        raise ValueError(f"Invalid position: {position}. Use one of {WATERMARK_POSITIONS}") from None
+    x = (width - watermark_width) * h_align // 2 + margin * (1 - h_align)
+    y = (height - watermark_height) * v_align // 2 + margin * (1 - v_align)
+    return max(0, x), max(0, y)
+
+
+# Watermark caches. A batch usually applies the same 1-3 watermark files to
+# every image, so each file is decoded once per process and each resized copy
+# is reused for all images of the same size. Keys include the file's mtime so
+# an edited watermark is picked up. Cached images are shared and must not be
+# modified; the sizes are kept small because each entry holds decoded pixels.
+@functools.lru_cache(maxsize=4)
+def _load_watermark(watermark_path: str, mtime_ns: int) -> Image:
+    """
+    Decode a watermark file (or take its pixels from preload_watermark).
+    
+    Decoded files are converted to the 8-bit sRGB + alpha pixels that
+    preloaded watermarks have, so a watermark looks the same whichever
+    way it reached the process.
+    """
+    preloaded = _PRELOADED_WATERMARKS.pop((watermark_path, mtime_ns), None)
+    if preloaded is not None:
+        return preloaded
+    watermark = Image(filename=watermark_path)
+    watermark.depth = 8
+    watermark.transform_colorspace('srgb')
+    if not watermark.alpha_channel:
+        watermark.alpha_channel = 'opaque'
+    return watermark
+
+
+# Watermarks decoded elsewhere (see preload_watermark), keyed like _load_watermark
+_PRELOADED_WATERMARKS = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _scaled_watermark(watermark_path: str, mtime_ns: int, width: int, height: int) -> Image:
+    """Return the watermark resized to width x height."""
+    watermark = _load_watermark(watermark_path, mtime_ns).clone()
+    watermark.resize(width, height)
+    return watermark
+
+
+def load_watermark(watermark_path: str) -> Image:
+    """
+    Decode a watermark file through the watermark cache.
+    
+    The returned image is shared and must not be modified.
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        WandException: If the file cannot be decoded
+    """
+    return _load_watermark(watermark_path, os.stat(watermark_path).st_mtime_ns)
+
+
+def export_watermark(watermark_path: str) -> Tuple[bytes, int, int, int]:
+    """
+    Decode a watermark into raw 8-bit RGBA pixels, for sharing with other processes.
+    
+    Returns:
+        Tuple of (pixels, width, height, mtime_ns of the file)
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        WandException: If the file cannot be decoded
+    """
+    mtime_ns = os.stat(watermark_path).st_mtime_ns
+    with _load_watermark(watermark_path, mtime_ns).clone() as watermark:
+        return watermark.make_blob('RGBA'), watermark.width, watermark.height, mtime_ns
+
+
+def preload_watermark(watermark_path: str, mtime_ns: int, pixels: bytes, width: int, height: int) -> None:
+    """
+    Put a watermark exported by export_watermark() into this process's
+    watermark cache, so the file doesn't have to be decoded here.
+    
+    Not used if the file has been modified since it was exported.
+    """
+    watermark = Image(blob=pixels, format='RGBA', width=width, height=height, depth=8)
+    _PRELOADED_WATERMARKS[(watermark_path, mtime_ns)] = watermark
+
 
 def add_watermark(
     image: Image,
@@ -124,10 +281,12 @@ def add_watermark(
         ValueError: If position is invalid or parameters are out of range
         WandException: If watermark cannot be loaded
     """
-    if not os.path.exists(watermark_path):
-        raise FileNotFoundError(f"Watermark file not found: {watermark_path}")
+    try:
+        mtime_ns = os.stat(watermark_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Watermark file not found: {watermark_path}") from None
     
-    if position not in WATERMARK_POSITIONS:
+    if position not in _POSITION_ALIGNMENT:
         raise ValueError(f"Invalid position: {position}. Use one of {WATERMARK_POSITIONS}")
     
     if not (0.0 <= opacity <= 1.0):
@@ -136,52 +295,80 @@ def add_watermark(
     if not (1.0 <= scale_percent <= 100.0):
         raise ValueError(f"Scale percent must be between 1.0 and 100.0, got {scale_percent}")
     
-    # Load watermark image
-    with Image(filename=watermark_path) as watermark:
-        # Calculate scaled size based on main image dimensions
-        main_smaller_dim = min(image.width, image.height)
-        target_size = int(main_smaller_dim * (scale_percent / 100.0))
-        
-        # Maintain aspect ratio when scaling
-        wm_ratio = watermark.width / watermark.height
-        if watermark.width > watermark.height:
-            new_width = target_size
-            new_height = int(target_size / wm_ratio)
-        else:
-            new_height = target_size
-            new_width = int(target_size * wm_ratio)
-        
-        # Resize watermark
-        watermark.resize(new_width, new_height)
-        
-        # Apply opacity (transparency)
-        if opacity < 1.0:
-            watermark.evaluate(operator='multiply', value=opacity, channel='alpha')
-        
-        # Calculate horizontal position
-        if position in ("top-left", "left", "bottom-left"):
-            x = margin
-        elif position in ("top", "center", "bottom"):
-            x = (image.width - watermark.width) // 2
-        else:  # top-right, right, bottom-right
-            x = image.width - watermark.width - margin
-        
-        # Calculate vertical position
-        if position in ("top-left", "top", "top-right"):
-            y = margin
-        elif position in ("left", "center", "right"):
-            y = (image.height - watermark.height) // 2
-        else:  # bottom-left, bottom, bottom-right
-            y = image.height - watermark.height - margin
-        
-        # Ensure position is not negative
-        x = max(0, x)
-        y = max(0, y)
-        
-        # Composite watermark onto main image
+    # Load watermark image (decoded once, then served from the cache)
+    source = _load_watermark(watermark_path, mtime_ns)
+    
+    # Calculate scaled size based on main image dimensions
+    main_smaller_dim = min(image.width, image.height)
+    target_size = int(main_smaller_dim * (scale_percent / 100.0))
+    
+    # Maintain aspect ratio when scaling
+    wm_ratio = source.width / source.height
+    if source.width > source.height:
+        new_width = target_size
+        new_height = int(target_size / wm_ratio)
+    else:
+        new_height = target_size
+        new_width = int(target_size * wm_ratio)
+    
+    # Resized watermark, shared by same-sized images
+    watermark = _scaled_watermark(watermark_path, mtime_ns, new_width, new_height)
+    
+    x, y = watermark_origin(position, image.width, image.height, watermark.width, watermark.height, margin)
+    
+    # Composite watermark onto main image. Opacity is applied by the
+    # 'dissolve' operator within the same pass, rather than by a separate
+    # pass over the watermark's alpha channel.
+    if opacity < 1.0:
+        image.composite(watermark, left=x, top=y, operator='dissolve', arguments=f'{opacity * 100:g}')
+    else:
         image.composite(watermark, left=x, top=y)
 
 
+def apply_operations(
+    image: Image,
+    border_thickness: Optional[int] = None,
+    border_color: str = "#FFFFFF",
+    saturation: Optional[int] = None,
+    watermarks: Optional[List[dict]] = None
+) -> None:
+    """
+    Apply saturation, border and watermarks to an image (in-place modification).
+    
+    This is the shared pipeline used for both processing and previews:
+    1. Saturation adjustment (if specified)
+    2. Border (if specified), so watermarks go on top of the border
+    3. Watermarks, in order (entries without a path are ignored)
+    
+    Args:
+        image: Wand Image object to modify
+        border_thickness: Border thickness in pixels (None or 0 = no border)
+        border_color: Border color as hex string
+        saturation: Saturation level 0-200 (100 or None = no change)
+        watermarks: List of watermark configs (see process_single_image)
+    """
+    # Apply saturation adjustment first (before border/watermarks)
+    if saturation is not None and saturation != 100:
+        adjust_saturation(image, saturation)
+    
+    # Apply border (so watermarks go on top of border)
+    if border_thickness is not None and border_thickness > 0:
+        add_border(image, border_thickness, border_color)
+    
+    # Apply all watermarks in order
+    if watermarks:
+        for wm in watermarks:
+            if wm.get('path'):
+                add_watermark(
+                    image,
+                    wm['path'],
+                    position=wm.get('position', 'center'),
+                    opacity=wm.get('opacity', 0.5),
+                    scale_percent=wm.get('scale', 25.0),
+                    margin=wm.get('margin', 20)
+                )
+
+
 def process_single_image(
     input_path: str,
     output_path: str,
@@ -189,7 +376,9 @@ def process_single_image(
     border_color: str = "#FFFFFF",
     saturation: Optional[int] = None,
     watermarks: Optional[List[dict]] = None,
-    preserve_format: bool = True
+    preserve_format: bool = True,
+    input_bytes: Optional[bytes] = None,
+    validated: bool = False
 ) -> dict:
     """
     Process a single image: apply saturation, border and/or watermarks, then save.
@@ -201,6 +390,9 @@ def process_single_image(
     4. Apply watermarks (if specified) - multiple watermarks supported
     5. Save to output path
     
+    If no operation would change the image and the output has the input's
+    extension, the file is copied instead.
+    
     Args:
         input_path: Path to the source image
         output_path: Path where processed image will be saved
@@ -213,7 +405,13 @@ def process_single_image(
             - opacity: 0.0-1.0
             - scale: Percentage of image size
             - margin: Pixels from edges
+            The list is only read, so one list can be shared across a batch.
         preserve_format: If True, keep original format; if False, save as PNG
+        input_bytes: Contents of input_path if already read (e.g. prefetched);
+            decoded from memory instead of reading the file again
+        validated: True if the caller has already made sure input_path is a
+            supported image file and created the output directory (as the
+            batch processor does once per batch), to skip those checks
         
     Returns:
         dict with keys:
@@ -230,40 +428,33 @@ def process_single_image(
     }
     
     try:
-        # Validate input file exists and is supported
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"Input file not found: {input_path}")
-        
-        if not is_supported_format(input_path):
-            raise ValueError(f"Unsupported image format: {os.path.splitext(input_path)[1]}")
+        if not validated:
+            validate_paths(input_path, output_path, input_bytes)
         
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
+        # Nothing would change: copy the file instead of decoding and
+        # re-encoding it (which for JPEG only loses quality)
+        if (not has_operations(border_thickness, saturation, watermarks)
+                and os.path.splitext(input_path)[1].lower() == os.path.splitext(output_path)[1].lower()):
+            if input_bytes is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(input_bytes)
+            else:
+                try:
+                    shutil.copyfile(input_path, output_path)
+                except shutil.SameFileError:
+                    pass  # Output is the input itself
+            result["success"] = True
+            return result
         
         # Load and process image
-        with Image(filename=input_path) as img:
-            # Apply saturation adjustment first (before border/watermarks)
-            if saturation is not None and saturation != 100:
-                adjust_saturation(img, saturation)
-            
-            # Apply border (so watermarks go on top of border)
-            if border_thickness is not None and border_thickness > 0:
-                add_border(img, border_thickness, border_color)
-            
-            # Apply all watermarks in order
-            if watermarks:
-                for wm in watermarks:
-                    if wm.get('path'):
-                        add_watermark(
-                            img,
-                            wm['path'],
-                            position=wm.get('position', 'center'),
-                            opacity=wm.get('opacity', 0.5),
-                            scale_percent=wm.get('scale', 25.0),
-                            margin=wm.get('margin', 20)
-                        )
+        if input_bytes is not None:
+            # The extension is passed as a format hint, as reading by filename does
+            source = Image(blob=input_bytes, format=os.path.splitext(input_path)[1][1:])
+        else:
+            source = Image(filename=input_path)
+        
+        with source as img:
+            apply_operations(img, border_thickness, border_color, saturation, watermarks)
             
             # Save the processed image
             img.save(filename=output_path)
@@ -284,18 +475,118 @@ def process_single_image(
     return result
 
 
+def has_operations(
+    border_thickness: Optional[int] = None,
+    saturation: Optional[int] = None,
+    watermarks: Optional[List[dict]] = None
+) -> bool:
+    """Check whether apply_operations() with these options would change any pixel."""
+    return (
+        (border_thickness is not None and border_thickness > 0)
+        or (saturation is not None and saturation != 100)
+        or any(wm.get('path') for wm in watermarks or ())
+    )
+
+
+def validate_paths(input_path: str, output_path: str, input_bytes: Optional[bytes]) -> None:
+    """
+    Check that input_path exists (unless its contents are given) and has a
+    supported format, and create output_path's directory.
+    
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        ValueError: If the input format is not supported
+    """
+    if input_bytes is None and not os.path.exists(input_path):
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+    
+    if not is_supported_format(input_path):
+        raise ValueError(f"Unsupported image format: {os.path.splitext(input_path)[1]}")
+    
+    # Ensure output directory exists
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+
+
+# Rendered previews, most recently used last. Dragging a slider back and
+# forth or toggling a control off and on again revisits settings that were
+# already rendered. Keys include the mtimes of the source and watermark
+# files, so edited files are rendered again.
+PREVIEW_CACHE_SIZE = 32
+_PREVIEW_CACHE: 'OrderedDict[tuple, bytes]' = OrderedDict()
+_PREVIEW_CACHE_LOCK = threading.Lock()
+
+# Encodings generate_preview() can return
+PREVIEW_FORMATS = ('jpeg', 'png')
+PREVIEW_JPEG_QUALITY = 85
+
+
+def _preview_cache_key(
+    input_path: str,
+    mtime_ns: int,
+    border_thickness: Optional[int],
+    border_color: str,
+    saturation: Optional[int],
+    watermarks: Optional[List[dict]],
+    max_preview_size: int,
+    preview_format: str
+) -> tuple:
+    """Build the _PREVIEW_CACHE key for a preview of input_path (as of mtime_ns)."""
+    watermarks_key = []
+    for wm in watermarks or ():
+        if wm.get('path'):
+            try:
+                wm_mtime_ns = os.stat(wm['path']).st_mtime_ns
+            except OSError:
+                wm_mtime_ns = None
+            watermarks_key.append((
+                wm['path'], wm_mtime_ns, wm.get('position', 'center'),
+                wm.get('opacity', 0.5), wm.get('scale', 25.0), wm.get('margin', 20)
+            ))
+    return (
+        input_path, mtime_ns,
+        border_thickness or 0, border_color if border_thickness else None,
+        100 if saturation is None else saturation,
+        tuple(watermarks_key), max_preview_size, preview_format
+    )
+
+
+def _get_cached_preview(key: tuple) -> Optional[bytes]:
+    """Get a cached preview (marking it as recently used), or None."""
+    with _PREVIEW_CACHE_LOCK:
+        image_bytes = _PREVIEW_CACHE.get(key)
+        if image_bytes is not None:
+            _PREVIEW_CACHE.move_to_end(key)
+        return image_bytes
+
+
+def _cache_preview(key: tuple, image_bytes: bytes) -> None:
+    """Add a rendered preview, evicting the least recently used beyond PREVIEW_CACHE_SIZE."""
+    with _PREVIEW_CACHE_LOCK:
+        _PREVIEW_CACHE[key] = image_bytes
+        _PREVIEW_CACHE.move_to_end(key)
+        while len(_PREVIEW_CACHE) > PREVIEW_CACHE_SIZE:
+            _PREVIEW_CACHE.popitem(last=False)
+
+
 def generate_preview(
     input_path: str,
     border_thickness: Optional[int] = None,
     border_color: str = "#FFFFFF",
     saturation: Optional[int] = None,
     watermarks: Optional[List[dict]] = None,
-    max_preview_size: int = 800
+    max_preview_size: int = 800,
+    preview_format: str = 'jpeg'
 ) -> Tuple[Optional[bytes], Optional[str]]:
     """
-    Generate a preview of the processed image as PNG bytes (for display in UI).
+    Generate a preview of the processed image as encoded bytes (for display in UI).
     
-    The preview is scaled down if larger than max_preview_size to save memory.
+    The image is scaled down to fit max_preview_size *before* the operations
+    are applied, with the border thickness and watermark margins scaled to
+    match, so they run on preview-sized pixels. The result is a close
+    approximation of process_single_image's output, not an exact
+    downscale of it. Recently rendered previews are returned from memory.
     
     Args:
         input_path: Path to the source image
@@ -304,10 +595,13 @@ def generate_preview(
         saturation: Saturation level 0-200 (100 = original, None = no change)
         watermarks: List of watermark configs (same format as process_single_image)
         max_preview_size: Maximum width or height for preview
+        preview_format: One of PREVIEW_FORMATS. JPEG (quality 85) encodes
+            several times faster than PNG; images with transparency are
+            always encoded as PNG (at a low compression level)
         
     Returns:
         Tuple of (image_bytes, error_message)
-        - On success: (PNG bytes, None)
+        - On success: (JPEG or PNG bytes, None)
         - On failure: (None, error message string)
     """
     try:
@@ -317,39 +611,234 @@ def generate_preview(
         if not is_supported_format(input_path):
             return None, f"Unsupported format: {os.path.splitext(input_path)[1]}"
         
-        with Image(filename=input_path) as img:
-            # Apply saturation adjustment first
-            if saturation is not None and saturation != 100:
-                adjust_saturation(img, saturation)
-            
-            # Apply border
-            if border_thickness is not None and border_thickness > 0:
-                add_border(img, border_thickness, border_color)
-            
-            # Apply all watermarks
-            if watermarks:
-                for wm in watermarks:
-                    if wm.get('path'):
-                        add_watermark(
-                            img,
-                            wm['path'],
-                            position=wm.get('position', 'center'),
-                            opacity=wm.get('opacity', 0.5),
-                            scale_percent=wm.get('scale', 25.0),
-                            margin=wm.get('margin', 20)
-                        )
-            
-            # Scale down for preview if needed
-            if img.width > max_preview_size or img.height > max_preview_size:
-                ratio = min(max_preview_size / img.width, max_preview_size / img.height)
-                new_width = int(img.width * ratio)
-                new_height = int(img.height * ratio)
-                img.resize(new_width, new_height)
-            
-            # Convert to PNG bytes
-            img.format = 'png'
-            return img.make_blob(), None
-            
+        if preview_format not in PREVIEW_FORMATS:
+            return None, f"Invalid preview format: {preview_format}. Use one of {PREVIEW_FORMATS}"
+        
+        key = _preview_cache_key(
+            input_path, os.stat(input_path).st_mtime_ns, border_thickness,
+            border_color, saturation, watermarks, max_preview_size, preview_format
+        )
+        image_bytes = _get_cached_preview(key)
+        if image_bytes is not None:
+            return image_bytes, None
+        
+        source, width, height = _load_preview_source(input_path, max_preview_size)
+        with source as img:
+            scale = _prepare_preview(img, width, height, border_thickness, border_color, saturation, max_preview_size)
+            apply_operations(img, watermarks=_scale_margins(watermarks, scale))
+            image_bytes = _encode_preview(img, max_preview_size, preview_format)
+        _cache_preview(key, image_bytes)
+        return image_bytes, None
+        
     except Exception as e:
         return None, f"{type(e).__name__}: {str(e)}"
 
+
+def _load_preview_source(input_path: str, max_preview_size: int) -> Tuple[Image, int, int]:
+    """
+    Decode an image for previewing.
+    
+    JPEGs are decoded straight to a reduced size (libjpeg scales by up to
+    1/8 while decoding) that is still at least max_preview_size, instead of
+    decoding every pixel only to shrink them afterwards.
+    
+    Returns:
+        Tuple of (image, full-size width, full-size height)
+    """
+    if os.path.splitext(input_path)[1].lower() not in ('.jpg', '.jpeg'):
+        image = Image(filename=input_path)
+        return image, image.width, image.height
+    
+    # The full size is read from the header; the border and margins
+    # are relative to it
+    with Image.ping(filename=input_path) as info:
+        width, height = info.width, info.height
+    
+    image = Image()
+    try:
+        image.options['jpeg:size'] = f'{max_preview_size}x{max_preview_size}'
+        image.read(filename=input_path)
+    except Exception:
+        image.close()
+        raise
+    return image, width, height
+
+
+def _prepare_preview(
+    image: Image,
+    width: int,
+    height: int,
+    border_thickness: Optional[int],
+    border_color: str,
+    saturation: Optional[int],
+    max_preview_size: int
+) -> float:
+    """
+    Scale a preview source down to preview size, then apply saturation and
+    the border, scaled by the same ratio (in-place modification).
+    
+    Args:
+        width, height: Size of the full-size image that image was decoded from
+        
+    Returns:
+        Ratio of preview to full-size pixels, for scaling watermark margins
+    """
+    # Fit the image *with* its border into max_preview_size
+    border = 2 * (border_thickness or 0)
+    scale = min(1.0, max_preview_size / (width + border), max_preview_size / (height + border))
+    
+    new_width = max(1, round(width * scale))
+    new_height = max(1, round(height * scale))
+    if (image.width, image.height) != (new_width, new_height):
+        image.resize(new_width, new_height)
+    
+    if border_thickness:
+        # Keep thin borders visible in the preview
+        border_thickness = max(1, round(border_thickness * scale))
+    apply_operations(image, border_thickness, border_color, saturation)
+    return scale
+
+
+def _scale_margins(watermarks: Optional[List[dict]], scale: float) -> Optional[List[dict]]:
+    """Get watermark configs with their margins scaled to preview size."""
+    if not watermarks or scale >= 1.0:
+        return watermarks
+    return [dict(wm, margin=round(wm.get('margin', 20) * scale)) for wm in watermarks]
+
+
+def _encode_preview(image: Image, max_preview_size: int, preview_format: str) -> bytes:
+    """Scale an image down to fit max_preview_size (in-place) and return it encoded."""
+    # Scale down for preview if needed
+    if image.width > max_preview_size or image.height > max_preview_size:
+        ratio = min(max_preview_size / image.width, max_preview_size / image.height)
+        new_width = int(image.width * ratio)
+        new_height = int(image.height * ratio)
+        image.resize(new_width, new_height)
+    
+    # JPEG can't store transparency
+    if preview_format == 'jpeg' and not image.alpha_channel:
+        image.format = 'jpeg'
+        image.compression_quality = PREVIEW_JPEG_QUALITY
+    else:
+        # Previews are throwaway: favor encode speed over file size
+        image.format = 'png'
+        image.options['png:compression-level'] = '1'
+    return image.make_blob()
+
+
+class PreviewSession:
+    """
+    Keeps a decoded source image in memory for repeated previews.
+    
+    generate_preview() reads and decodes the file on every call. When the
+    same image is re-rendered many times (e.g. while the user drags a
+    slider), a session decodes it once, at reduced size where possible, and
+    each render only clones the in-memory pixels before applying the
+    operations. The image after
+    saturation and border is kept too, so a render that only changes
+    watermarks starts from it. Rendered previews share generate_preview()'s
+    cache.
+    
+    A session is not safe for concurrent use; callers must serialize access.
+    
+    Usage:
+        with PreviewSession("photo.jpg") as session:
+            image_bytes, error = session.render(border_thickness=20)
+    """
+    
+    def __init__(self, input_path: str, max_preview_size: int = 800):
+        """
+        Load the source image, at reduced size where the format allows it
+        (see _load_preview_source). Renders are sharpest up to this
+        max_preview_size.
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the format is not supported
+            WandException: If the image cannot be decoded
+        """
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"File not found: {input_path}")
+        
+        if not is_supported_format(input_path):
+            raise ValueError(f"Unsupported format: {os.path.splitext(input_path)[1]}")
+        
+        self.input_path = input_path
+        self._mtime_ns = os.stat(input_path).st_mtime_ns
+        self._source: Optional[Image]
+        self._source, self._width, self._height = _load_preview_source(input_path, max_preview_size)
+        # (border_thickness, border_color, saturation, max_preview_size) ->
+        # scale and the preview-sized source with those applied
+        self._prepared: Optional[Tuple[tuple, float, Image]] = None
+    
+    def render(
+        self,
+        border_thickness: Optional[int] = None,
+        border_color: str = "#FFFFFF",
+        saturation: Optional[int] = None,
+        watermarks: Optional[List[dict]] = None,
+        max_preview_size: int = 800,
+        preview_format: str = 'jpeg'
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Render a preview of the source image with the given settings.
+        
+        Arguments and return value are the same as generate_preview().
+        """
+        if self._source is None:
+            return None, "Preview session is closed"
+        
+        if preview_format not in PREVIEW_FORMATS:
+            return None, f"Invalid preview format: {preview_format}. Use one of {PREVIEW_FORMATS}"
+        
+        try:
+            key = _preview_cache_key(
+                self.input_path, self._mtime_ns, border_thickness,
+                border_color, saturation, watermarks, max_preview_size, preview_format
+            )
+            image_bytes = _get_cached_preview(key)
+            if image_bytes is not None:
+                return image_bytes, None
+            
+            prepared_key = key[2:5] + (max_preview_size,)
+            if self._prepared is None or self._prepared[0] != prepared_key:
+                self._release_prepared()
+                prepared = self._source.clone()
+                try:
+                    scale = _prepare_preview(
+                        prepared, self._width, self._height, border_thickness,
+                        border_color, saturation, max_preview_size
+                    )
+                except Exception:
+                    prepared.close()
+                    raise
+                self._prepared = (prepared_key, scale, prepared)
+            
+            _, scale, prepared = self._prepared
+            with prepared.clone() as img:
+                apply_operations(img, watermarks=_scale_margins(watermarks, scale))
+                image_bytes = _encode_preview(img, max_preview_size, preview_format)
+            _cache_preview(key, image_bytes)
+            return image_bytes, None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {str(e)}"
+    
+    def _release_prepared(self) -> None:
+        """Release the image kept after saturation and border."""
+        if self._prepared is not None:
+            self._prepared[2].close()
+            self._prepared = None
+    
+    def close(self) -> None:
+        """Release the decoded source image."""
+        self._release_prepared()
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+    
+    def __enter__(self) -> 'PreviewSession':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
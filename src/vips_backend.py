@@ -0,0 +1,381 @@
+"""
+libvips Processing Backend
+
+Optional implementation of process_single_image using pyvips (libvips).
+
+libvips evaluates the whole saturation -> border -> watermark chain as one
+demand-driven pipeline when the image is saved, processing it in small
+tiles with vectorized operations, instead of materializing the full image
+after every step as ImageMagick does. It is only used when chosen with
+ProcessingConfig.image_backend = "vips" (and pyvips and libvips are
+installed); Wand is the default and handles everything this backend
+doesn't (formats libvips can't read or write such as BMP, animations and
+multi-page files, grayscale, 16-bit or CMYK images, non-hex border
+colors). Previews always use Wand.
+
+Results can differ slightly from the Wand backend (resampling, rounding),
+so previews match the output less closely, and JPEG/WebP files are saved
+at quality 95.
+"""
+
+import os
+import functools
+from typing import Optional, List, Tuple
+
+# libvips is loaded when pyvips is imported: a missing library raises OSError
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+from . import image_processor
+from .image_processor import has_operations, saturation_matrix, validate_paths, watermark_origin, WATERMARK_POSITIONS
+
+
+VIPS_AVAILABLE = pyvips is not None
+
+if VIPS_AVAILABLE:
+    # Every image is loaded, processed and saved once: libvips' operation
+    # cache would only hold on to memory
+    pyvips.cache_set_max(0)
+
+_WATERMARK_POSITION_SET = frozenset(WATERMARK_POSITIONS)
+
+# Save options by output extension (libvips defaults to JPEG quality 75)
+_SAVE_OPTIONS = {
+    '.jpg': {'Q': 95},
+    '.jpeg': {'Q': 95},
+    '.webp': {'Q': 95},
+}
+
+
+def _parse_hex_color(color: str) -> Optional[List[int]]:
+    """
+    Parse "#RGB" or "#RRGGBB" into [r, g, b].
+    
+    Returns None for any other color syntax (left to ImageMagick).
+    """
+    digits = color[1:] if color.startswith('#') else ''
+    if len(digits) == 3:
+        digits = ''.join(c * 2 for c in digits)
+    if len(digits) != 6:
+        return None
+    try:
+        return [int(digits[i:i + 2], 16) for i in (0, 2, 4)]
+    except ValueError:
+        return None
+
+
+def _as_srgb(image: 'pyvips.Image') -> Optional['pyvips.Image']:
+    """
+    Get a loaded image as 8-bit sRGB (or sRGB + alpha).
+    
+    Returns None for images this backend doesn't handle, so they can be
+    processed by Wand unchanged. That includes grayscale images, which
+    would otherwise be saved expanded to three color bands.
+    """
+    if image.format != 'uchar':
+        return None
+    if image.interpretation == 'srgb' and image.bands in (3, 4):
+        return image
+    return None
+
+
+def _can_load(input_path: str, input_bytes: Optional[bytes]) -> bool:
+    """Check whether libvips has a loader for the input (sniffed from its header)."""
+    if input_bytes is not None:
+        loader = pyvips.vips_lib.vips_foreign_find_load_buffer(input_bytes, len(input_bytes))
+    else:
+        loader = pyvips.vips_lib.vips_foreign_find_load(os.fsencode(input_path))
+    if loader == pyvips.ffi.NULL:
+        # The failed lookup leaves a message in libvips' error buffer
+        pyvips.vips_lib.vips_error_clear()
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _can_save(ext: str) -> bool:
+    """Check whether libvips has a saver for an output extension."""
+    if pyvips.vips_lib.vips_foreign_find_save(os.fsencode('output' + ext)) == pyvips.ffi.NULL:
+        pyvips.vips_lib.vips_error_clear()
+        return False
+    return True
+
+
+def _page_count(image: 'pyvips.Image') -> int:
+    """Get the number of pages or frames in a loaded image."""
+    if image.get_typeof('n-pages') == 0:
+        return 1
+    return image.get('n-pages')
+
+
+# Watermark caches, like the ones in image_processor: each file is decoded
+# once per process (keyed on its mtime, so edits are picked up) and each
+# resized copy is shared by all images of the same size.
+@functools.lru_cache(maxsize=4)
+def _load_watermark(watermark_path: str, mtime_ns: int) -> 'pyvips.Image':
+    """Decode a watermark into memory as 8-bit sRGB with alpha."""
+    watermark = _PRELOADED_WATERMARKS.pop((watermark_path, mtime_ns), None)
+    if watermark is not None:
+        return watermark
+    
+    watermark = pyvips.Image.new_from_file(watermark_path, access='random')
+    if watermark.interpretation != 'srgb' or watermark.format != 'uchar':
+        watermark = watermark.colourspace('srgb')
+    if not watermark.hasalpha():
+        watermark = watermark.bandjoin(255)
+    return watermark.copy_memory()
+
+
+# Watermarks handed over by preload_watermark(), moved into the cache
+# the first time they are loaded
+_PRELOADED_WATERMARKS = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _scaled_watermark(
+    watermark_path: str,
+    mtime_ns: int,
+    width: int,
+    height: int,
+    opacity: float
+) -> 'pyvips.Image':
+    """Get a watermark resized to width x height with opacity applied."""
+    source = _load_watermark(watermark_path, mtime_ns)
+    
+    # Resize with premultiplied alpha so transparent pixels don't bleed
+    # their color into the edges
+    watermark = source.premultiply().resize(
+        width / source.width, vscale=height / source.height
+    ).unpremultiply()
+    if opacity < 1.0:
+        watermark = watermark * [1.0, 1.0, 1.0, opacity]
+    return watermark.cast('uchar').copy_memory()
+
+
+def load_watermark(watermark_path: str) -> 'pyvips.Image':
+    """
+    Load a watermark into this process's cache (see image_processor.load_watermark).
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        pyvips.Error: If the file cannot be decoded
+    """
+    return _load_watermark(watermark_path, os.stat(watermark_path).st_mtime_ns)
+
+
+def export_watermark(watermark_path: str) -> Tuple[bytes, int, int, int]:
+    """
+    Decode a watermark into raw 8-bit RGBA pixels (see image_processor.export_watermark).
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        pyvips.Error: If the file cannot be decoded
+    """
+    mtime_ns = os.stat(watermark_path).st_mtime_ns
+    watermark = _load_watermark(watermark_path, mtime_ns)
+    return watermark.write_to_memory(), watermark.width, watermark.height, mtime_ns
+
+
+def preload_watermark(watermark_path: str, mtime_ns: int, pixels: bytes, width: int, height: int) -> None:
+    """
+    Put a watermark exported by export_watermark() into this process's
+    watermark cache, so the file doesn't have to be decoded here.
+    """
+    watermark = pyvips.Image.new_from_memory(pixels, width, height, 4, 'uchar')
+    _PRELOADED_WATERMARKS[(watermark_path, mtime_ns)] = watermark.copy(interpretation='srgb')
+
+
+def use_single_thread() -> None:
+    """
+    Make libvips run each pipeline on one thread, for worker processes of
+    a pool that already processes one image per CPU core.
+    """
+    pyvips.concurrency_set(1)
+
+
+def add_watermark(
+    image: 'pyvips.Image',
+    watermark_path: str,
+    position: str = "center",
+    opacity: float = 0.5,
+    scale_percent: float = 25.0,
+    margin: int = 20
+) -> 'pyvips.Image':
+    """
+    Overlay a watermark onto an image, sized and placed like
+    image_processor.add_watermark.
+    
+    Returns:
+        The watermarked image (with an alpha band only if image had one)
+    
+    Raises:
+        FileNotFoundError: If watermark file doesn't exist
+        ValueError: If position is invalid or parameters are out of range
+    """
+    try:
+        mtime_ns = os.stat(watermark_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Watermark file not found: {watermark_path}") from None
+    
+    if position not in _WATERMARK_POSITION_SET:
+        raise ValueError(f"Invalid position: {position}. Use one of {WATERMARK_POSITIONS}")
+    
+    if not (0.0 <= opacity <= 1.0):
+        raise ValueError(f"Opacity must be between 0.0 and 1.0, got {opacity}")
+    
+    if not (1.0 <= scale_percent <= 100.0):
+        raise ValueError(f"Scale percent must be between 1.0 and 100.0, got {scale_percent}")
+    
+    source = _load_watermark(watermark_path, mtime_ns)
+    
+    # Calculate scaled size based on main image dimensions
+    target_size = int(min(image.width, image.height) * (scale_percent / 100.0))
+    wm_ratio = source.width / source.height
+    if source.width > source.height:
+        new_width = target_size
+        new_height = int(target_size / wm_ratio)
+    else:
+        new_height = target_size
+        new_width = int(target_size * wm_ratio)
+    
+    if new_width < 1 or new_height < 1:
+        return image
+    
+    watermark = _scaled_watermark(watermark_path, mtime_ns, new_width, new_height, opacity)
+    
+    x, y = watermark_origin(position, image.width, image.height, watermark.width, watermark.height, margin)
+    
+    bands = image.bands
+    result = image.composite2(watermark, 'over', x=x, y=y)
+    
+    # composite2 always adds an alpha band; drop it again for opaque images
+    if result.bands > bands:
+        result = result.extract_band(0, n=bands)
+    return result
+
+
+def apply_operations(
+    image: 'pyvips.Image',
+    border_thickness: Optional[int] = None,
+    border_rgb: Optional[List[int]] = None,
+    saturation: Optional[int] = None,
+    watermarks: Optional[List[dict]] = None
+) -> 'pyvips.Image':
+    """
+    Build the saturation -> border -> watermarks pipeline on an 8-bit sRGB
+    image (see image_processor.apply_operations).
+    
+    Nothing is computed here: libvips runs the whole chain when the
+    returned image is saved.
+    """
+    if saturation is not None and saturation != 100:
+        if not (0 <= saturation <= 200):
+            raise ValueError(f"Saturation must be between 0 and 200, got {saturation}")
+        # Same color matrix as the Wand backend; an alpha band is passed through
+        rgb = image.extract_band(0, n=3).recomb([list(row) for row in saturation_matrix(saturation)])
+        if image.bands > 3:
+            rgb = rgb.bandjoin(image.extract_band(3, n=image.bands - 3))
+        image = rgb.cast('uchar')
+    
+    if border_thickness is not None and border_thickness > 0:
+        background = border_rgb + [255] * (image.bands - 3)
+        image = image.embed(
+            border_thickness, border_thickness,
+            image.width + 2 * border_thickness, image.height + 2 * border_thickness,
+            extend='background', background=background
+        )
+    
+    for wm in watermarks or ():
+        if wm.get('path'):
+            image = add_watermark(
+                image,
+                wm['path'],
+                position=wm.get('position', 'center'),
+                opacity=wm.get('opacity', 0.5),
+                scale_percent=wm.get('scale', 25.0),
+                margin=wm.get('margin', 20)
+            )
+    
+    return image
+
+
+def process_single_image(
+    input_path: str,
+    output_path: str,
+    border_thickness: Optional[int] = None,
+    border_color: str = "#FFFFFF",
+    saturation: Optional[int] = None,
+    watermarks: Optional[List[dict]] = None,
+    preserve_format: bool = True,
+    input_bytes: Optional[bytes] = None,
+    validated: bool = False
+) -> dict:
+    """
+    Process a single image with libvips.
+    
+    Takes the same arguments and returns the same result dict as
+    image_processor.process_single_image, which it falls back to for
+    images and options this backend doesn't handle.
+    """
+    output_ext = os.path.splitext(output_path)[1].lower()
+    border_rgb = _parse_hex_color(border_color)
+    
+    # Images without operations are just copied, and formats libvips
+    # can't read or write (such as BMP) are left to ImageMagick
+    if (
+        border_rgb is None
+        or not has_operations(border_thickness, saturation, watermarks)
+        or not _can_save(output_ext)
+        or not _can_load(input_path, input_bytes)
+    ):
+        return image_processor.process_single_image(
+            input_path, output_path, border_thickness, border_color,
+            saturation, watermarks, preserve_format, input_bytes, validated
+        )
+    
+    result = {
+        "success": False,
+        "input_path": input_path,
+        "output_path": output_path,
+        "error": None
+    }
+    
+    try:
+        if not validated:
+            validate_paths(input_path, output_path, input_bytes)
+        
+        # The pipeline runs top to bottom, so the source can be streamed
+        # through in strips instead of being decoded into memory whole
+        if input_bytes is not None:
+            source = pyvips.Image.new_from_buffer(input_bytes, '', access='sequential')
+        else:
+            source = pyvips.Image.new_from_file(input_path, access='sequential')
+        
+        # libvips only loads the first page of multi-page TIFFs and the
+        # first frame of animations, which Wand processes in full
+        image = _as_srgb(source) if _page_count(source) == 1 else None
+        if image is None:
+            return image_processor.process_single_image(
+                input_path, output_path, border_thickness, border_color,
+                saturation, watermarks, preserve_format, input_bytes, validated=True
+            )
+        
+        image = apply_operations(image, border_thickness, border_rgb, saturation, watermarks)
+        image.write_to_file(output_path, **_SAVE_OPTIONS.get(output_ext, {}))
+        
+        result["success"] = True
+    
+    except FileNotFoundError as e:
+        result["error"] = str(e)
+    except ValueError as e:
+        result["error"] = str(e)
+    except pyvips.Error as e:
+        result["error"] = f"libvips error: {str(e)}"
+    except PermissionError as e:
+        result["error"] = f"Permission denied: {str(e)}"
+    except Exception as e:
+        result["error"] = f"Unexpected error: {type(e).__name__}: {str(e)}"
+    
+    return result
@@ -9,6 +9,9 @@ Usage Examples:
     # Test with border only
     python test_cli.py --input ./test_images --output ./output --border 20 --border-color "#FF5500"
     
+    # Process one image at a time (easier to debug)
+    python test_cli.py --input ./test_images --output ./output --border 20 --jobs 1
+    
     # Test with watermark only
     python test_cli.py --input ./test_images --output ./output --watermark ./logo.png --wm-position center
     
@@ -22,13 +25,13 @@ Usage Examples:
 import argparse
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.image_processor import (
     process_single_image,
-    is_supported_format,
     SUPPORTED_FORMATS
 )
 from src.batch_processor import (
@@ -37,6 +40,7 @@ from src.batch_processor import (
     ProcessingProgress,
     ProcessingState,
     WatermarkConfig,
+    find_image_files,
     process_folder
 )
 
@@ -61,8 +65,9 @@ def print_progress(progress: ProcessingProgress) -> None:
             print(f"\nErrors encountered:")
             for err in progress.errors[:10]:  # Show first 10 errors
                 print(f"  - {err['file']}: {err['error']}")
-            if len(progress.errors) > 10:
-                print(f"  ... and {len(progress.errors) - 10} more errors")
+            hidden = len(progress.errors) - 10 + progress.errors_truncated
+            if hidden > 0:
+                print(f"  ... and {hidden} more errors")
     elif progress.state == ProcessingState.CANCELLED:
         print(f"\n\nProcessing cancelled at {progress.processed_count}/{progress.total_files}")
     elif progress.state == ProcessingState.ERROR:
@@ -114,6 +119,7 @@ def process_batch(args) -> int:
     print(f"  Input folder:  {args.input}")
     print(f"  Output folder: {args.output}")
     print(f"  Border: {args.border}px, color: {args.border_color}")
+    print(f"  Jobs:   {args.jobs if args.jobs > 0 else 'auto'}")
     if args.watermark:
         print(f"  Watermark: {args.watermark}")
         print(f"    Position: {args.wm_position}")
@@ -130,9 +136,9 @@ def process_batch(args) -> int:
     # Create output folder
     os.makedirs(args.output, exist_ok=True)
     
-    # Count images
-    image_count = sum(1 for f in os.listdir(args.input) 
-                      if is_supported_format(os.path.join(args.input, f)))
+    # List images once; process_folder reuses the list instead of rescanning
+    image_files = find_image_files(args.input)
+    image_count = len(image_files)
     print(f"Found {image_count} images to process")
     print(f"Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}")
     print()
@@ -159,7 +165,10 @@ def process_batch(args) -> int:
         border_thickness=args.border,
         border_color=args.border_color,
         watermarks=watermarks,
-        progress_callback=print_progress
+        progress_callback=print_progress,
+        parallel_processing=args.jobs != 1,
+        max_workers=args.jobs,
+        file_list=image_files
     )
     
     # Print final status
@@ -168,6 +177,35 @@ def process_batch(args) -> int:
     return 0 if final_progress.error_count == 0 else 1
 
 
+# Test images made by create_test_structure: (width, height, background)
+TEST_IMAGES = [
+    (800, 600, '#3498db'),   # Blue
+    (1200, 800, '#e74c3c'),  # Red
+    (640, 480, '#2ecc71'),   # Green
+    (1920, 1080, '#9b59b6'), # Purple
+    (500, 500, '#f39c12'),   # Orange
+]
+
+
+def _make_test_image(input_dir: str, i: int, w: int, h: int, color: str) -> str:
+    """Create one test image (run in a worker process). Returns its description."""
+    from wand.image import Image
+    from wand.color import Color
+    from wand.drawing import Drawing
+    
+    with Image(width=w, height=h, background=Color(color)) as img:
+        # Add some text
+        with Drawing() as draw:
+            draw.font_size = 48
+            draw.fill_color = Color('white')
+            draw.text(w // 4, h // 2, f'Test Image {i}')
+            draw.text(w // 4, h // 2 + 60, f'{w}x{h}')
+            draw(img)
+        
+        img.save(filename=os.path.join(input_dir, f'test_image_{i}.jpg'))
+    return f"test_image_{i}.jpg ({w}x{h})"
+
+
 def create_test_structure(args) -> int:
     """Create a test folder structure for testing."""
     test_dir = args.create_test
@@ -186,25 +224,15 @@ def create_test_structure(args) -> int:
         from wand.color import Color
         from wand.drawing import Drawing
         
-        # Create a few test images with different sizes and content
-        for i, (w, h, color) in enumerate([
-            (800, 600, '#3498db'),   # Blue
-            (1200, 800, '#e74c3c'),  # Red
-            (640, 480, '#2ecc71'),   # Green
-            (1920, 1080, '#9b59b6'), # Purple
-            (500, 500, '#f39c12'),   # Orange
-        ], 1):
-            with Image(width=w, height=h, background=Color(color)) as img:
-                # Add some text
-                with Drawing() as draw:
-                    draw.font_size = 48
-                    draw.fill_color = Color('white')
-                    draw.text(w // 4, h // 2, f'Test Image {i}')
-                    draw.text(w // 4, h // 2 + 60, f'{w}x{h}')
-                    draw(img)
-                
-                img.save(filename=os.path.join(input_dir, f'test_image_{i}.jpg'))
-                print(f"  Created: test_image_{i}.jpg ({w}x{h})")
+        # Create a few test images with different sizes and content. They
+        # are independent, so each is rendered in its own process
+        with ProcessPoolExecutor(max_workers=len(TEST_IMAGES)) as executor:
+            futures = [
+                executor.submit(_make_test_image, input_dir, i, w, h, color)
+                for i, (w, h, color) in enumerate(TEST_IMAGES, 1)
+            ]
+            for future in as_completed(futures):
+                print(f"  Created: {future.result()}")
         
         # Create a simple watermark image
         with Image(width=200, height=80, background=Color('transparent')) as wm:
@@ -277,6 +305,12 @@ Examples:
     parser.add_argument('--border-color', '-c', default='#FFFFFF',
                         help='Border color as hex (default: #FFFFFF = white)')
     
+    # Parallelism
+    parser.add_argument('--jobs', '-j', type=int, default=0, metavar='N',
+                        help='Number of images processed in parallel '
+                             '(default: 0 = automatic, CPU count minus 1-2, max 12; '
+                             '1 = sequential)')
+    
     # Watermark settings
     parser.add_argument('--watermark', '-w', metavar='FILE',
                         help='Watermark image file path')
@@ -1,16 +1,20 @@
 """
 Quick test to verify saturation adjustment with Wand.
-Run this script to test if Wand's modulate function works correctly.
+Run this script to test if image_processor.adjust_saturation (a color
+matrix applied with Wand) works correctly.
 """
 
 import os
 import sys
+import shutil
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from wand.image import Image
 
+from src.image_processor import adjust_saturation, saturation_matrix
+
 
 def test_saturation():
     """Test saturation adjustment on a test image."""
@@ -46,30 +50,41 @@ def test_saturation():
     # Test different saturation values
     saturation_values = [0, 50, 100, 150, 200]
     
-    for sat in saturation_values:
-        output_file = f"test_output_sat_{sat}.png"
-        
-        with Image(filename=test_image) as img:
+    # Decode once; each value works on an in-memory copy of the pixels
+    with Image(filename=test_image) as base:
+        for sat in saturation_values:
+            output_file = f"test_output_sat_{sat}.png"
+            
             print(f"\nTesting saturation={sat}")
-            print(f"  Image size: {img.width}x{img.height}")
-            print(f"  Image format: {img.format}")
+            print(f"  Image size: {base.width}x{base.height}")
+            print(f"  Image format: {base.format}")
             
-            # Apply saturation
-            if sat != 100:
-                print(f"  Applying modulate(brightness=100.0, saturation={float(sat)}, hue=100.0)")
-                img.modulate(brightness=100.0, saturation=float(sat), hue=100.0)
-            else:
-                print(f"  Skipping modulate (saturation=100 means no change)")
+            # No change to a PNG: the output is a plain copy, no encode needed
+            if sat == 100 and test_image.lower().endswith('.png'):
+                print(f"  Skipping adjustment (saturation=100 means no change), copying the file")
+                shutil.copyfile(test_image, output_file)
+                print(f"  Saved to: {output_file}")
+                continue
             
-            # Save output
-            img.save(filename=output_file)
-            print(f"  Saved to: {output_file}")
+            with base.clone() as img:
+                # Apply saturation
+                if sat != 100:
+                    print(f"  Applying adjust_saturation(saturation={sat})")
+                    for row in saturation_matrix(sat):
+                        print("    [" + ", ".join(f"{value:.3f}" for value in row) + "]")
+                    adjust_saturation(img, sat)
+                else:
+                    print(f"  Skipping adjustment (saturation=100 means no change)")
+                
+                # Save output
+                img.save(filename=output_file)
+                print(f"  Saved to: {output_file}")
     
     print("\n" + "=" * 50)
     print("Test complete! Check the output files:")
     for sat in saturation_values:
         print(f"  - test_output_sat_{sat}.png")
-    print("\nIf saturation=0 shows a grayscale image, Wand is working correctly.")
+    print("\nIf saturation=0 shows a grayscale image, the saturation adjustment is working correctly.")
 
 
 def test_with_real_image(image_path: str):
@@ -80,19 +95,20 @@ def test_with_real_image(image_path: str):
     
     print(f"Testing with image: {image_path}")
     
-    with Image(filename=image_path) as img:
-        print(f"Original size: {img.width}x{img.height}")
+    with Image(filename=image_path) as base:
+        print(f"Original size: {base.width}x{base.height}")
         
-        # Test grayscale (saturation=0)
-        img.modulate(brightness=100.0, saturation=0.0, hue=100.0)
-        img.save(filename="test_grayscale.png")
-        print("Saved grayscale version to: test_grayscale.png")
+        with base.clone() as img:
+            # Test grayscale (saturation=0)
+            adjust_saturation(img, 0)
+            img.save(filename="test_grayscale.png")
+            print("Saved grayscale version to: test_grayscale.png")
         
-    with Image(filename=image_path) as img:
-        # Test high saturation
-        img.modulate(brightness=100.0, saturation=200.0, hue=100.0)
-        img.save(filename="test_vivid.png")
-        print("Saved high saturation version to: test_vivid.png")
+        with base.clone() as img:
+            # Test high saturation
+            adjust_saturation(img, 200)
+            img.save(filename="test_vivid.png")
+            print("Saved high saturation version to: test_vivid.png")
 
 
 if __name__ == "__main__":
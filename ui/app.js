@@ -19,7 +19,9 @@ const state = {
         overwrite_existing: false
     },
     previewImagePath: '',
-    imageCount: 0,
+    previewSessionPath: null,
+    imageCount: 0,  // null while the input folder is being counted
+    imageCountFolder: null,  // Folder the current imageCount belongs to
     isProcessing: false,
     nextWatermarkId: 1,
     // Time estimation
@@ -274,17 +276,42 @@ function clearWatermark() {
 
 async function updateImageCount() {
     if (state.config.input_folder) {
+        // The previous folder's count no longer applies
+        state.imageCount = null;
+        state.imageCountFolder = null;
         const result = await api('count_images', state.config.input_folder);
-        state.imageCount = result.count;
-        elements.inputCount.textContent = result.count > 0 
-            ? `${result.count} image${result.count !== 1 ? 's' : ''} found`
-            : 'No supported images found';
+        if (!result.pending) {
+            applyImageCount(result);
+        } else if (state.imageCountFolder === null) {
+            // Scan runs in the background; window.onCountReady delivers the result
+            elements.inputCount.textContent = 'Counting images...';
+            updateProcessSummary();
+        }
     } else {
         state.imageCount = 0;
+        state.imageCountFolder = null;
         elements.inputCount.textContent = '';
+        updateProcessSummary();
     }
 }
 
+function applyImageCount(result) {
+    state.imageCount = result.count;
+    state.imageCountFolder = result.folder_path || state.config.input_folder;
+    elements.inputCount.textContent = result.count > 0 
+        ? `${result.count} image${result.count !== 1 ? 's' : ''} found`
+        : 'No supported images found';
+    updateProcessSummary();
+}
+
+window.onCountReady = function(result) {
+    // Ignore results for a folder that is no longer selected
+    if (result.folder_path !== state.config.input_folder) {
+        return;
+    }
+    applyImageCount(result);
+};
+
 // ==================== Border Settings ====================
 function updateBorderThickness() {
     const value = elements.borderThickness.value;
@@ -570,19 +597,34 @@ async function generatePreview() {
     const startTime = performance.now();
     
     try {
-        const result = await api('generate_preview', state.config, state.previewImagePath);
+        // Decode the image once per selection; re-renders only clone it
+        const opening = state.previewSessionPath !== state.previewImagePath;
+        if (opening) {
+            const opened = await api('open_preview_session', state.previewImagePath);
+            if (!opened.success) {
+                state.previewSessionPath = null;
+                elements.previewPlaceholder.classList.remove('hidden');
+                showToast(`Preview error: ${opened.error}`, 'error');
+                return;
+            }
+            state.previewSessionPath = state.previewImagePath;
+        }
         
-        // Calculate preview time
-        const endTime = performance.now();
-        state.lastPreviewTime = endTime - startTime;
+        const result = await api('update_preview', state.config);
         
-        // Estimate time per full-size image (preview is scaled to 800px, so multiply by factor)
-        // Factor accounts for: larger file size, no downscaling, disk I/O for saving
-        const PREVIEW_TO_FULL_MULTIPLIER = 2.0;
-        state.estimatedTimePerImage = (state.lastPreviewTime / 1000) * PREVIEW_TO_FULL_MULTIPLIER;
+        // Only time renders that include decoding, as every batch image is decoded
+        if (opening) {
+            const endTime = performance.now();
+            state.lastPreviewTime = endTime - startTime;
+            
+            // Estimate time per full-size image (preview is scaled to 800px, so multiply by factor)
+            // Factor accounts for: larger file size, no downscaling, disk I/O for saving
+            const PREVIEW_TO_FULL_MULTIPLIER = 2.0;
+            state.estimatedTimePerImage = (state.lastPreviewTime / 1000) * PREVIEW_TO_FULL_MULTIPLIER;
+        }
         
         if (result.success) {
-            elements.previewImage.src = result.image_data;
+            elements.previewImage.src = result.image_url;
             elements.previewImage.classList.remove('hidden');
             elements.previewInfo.textContent = state.previewImagePath.split(/[\\/]/).pop();
         } else {
@@ -603,7 +645,7 @@ function updateProcessSummary() {
     // Update summary values
     elements.summaryInput.textContent = state.config.input_folder || 'Not selected';
     elements.summaryOutput.textContent = state.config.output_folder || 'Not selected';
-    elements.summaryCount.textContent = state.imageCount;
+    elements.summaryCount.textContent = state.imageCount === null ? 'Counting...' : state.imageCount;
     
     // Border summary
     if (state.config.border_thickness > 0) {
@@ -639,7 +681,10 @@ function updateProcessSummary() {
     }
     
     // Time estimate
-    if (state.estimatedTimePerImage && state.imageCount > 0) {
+    if (state.imageCount === null) {
+        elements.summaryTimeEstimate.textContent = 'Counting images...';
+        elements.summaryTimeEstimate.classList.remove('has-estimate');
+    } else if (state.estimatedTimePerImage && state.imageCount > 0) {
         const totalEstimate = state.estimatedTimePerImage * state.imageCount;
         elements.summaryTimeEstimate.textContent = `~${formatDuration(totalEstimate)} (${state.imageCount} images)`;
         elements.summaryTimeEstimate.classList.add('has-estimate');
@@ -670,6 +715,12 @@ async function validateAndProcess() {
     // Hide validation errors
     elements.validationErrors.classList.add('hidden');
     
+    // The count is still being computed (see window.onCountReady)
+    if (state.imageCount === null) {
+        showToast('Still counting images, try again in a moment', 'warning');
+        return;
+    }
+    
     // Check if there are images to process
     if (state.imageCount === 0) {
         showToast('No images to process', 'warning');
@@ -786,6 +837,9 @@ window.onProcessingComplete = function(progress) {
         elements.errorLog.innerHTML = progress.errors
             .map(err => `<div class="error-log-entry"><span class="error-log-file">${err.file}:</span><span class="error-log-message">${err.error}</span></div>`)
             .join('');
+        if (progress.errors_truncated > 0) {
+            elements.errorLog.innerHTML += `<div class="error-log-entry"><span class="error-log-message">... and ${progress.errors_truncated} more errors</span></div>`;
+        }
     } else {
         elements.errorDetails.classList.add('hidden');
     }